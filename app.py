@@ -1,14 +1,6 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.graph_objects as go
-import plotly.express as px
-import time
-from datetime import datetime, timedelta
+from datetime import datetime
 import random
-from typing import Dict, List, Tuple
-import threading
-import asyncio
 
 # Configure Streamlit page
 st.set_page_config(
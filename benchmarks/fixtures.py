@@ -0,0 +1,90 @@
+"""Deterministic fixture payloads for the pipeline benchmarks.
+
+Slates of up to a full season use the registry's real 272-game schedule (the
+first 16 games of a 16-game run are Week 1). Larger slates use numbered
+fixture teams, which the registry prices at its default ratings, so every
+game key stays unique. The HTML page always names registry teams, since the
+fallback parser only recognises those.
+"""
+
+import json
+import random
+from typing import List, Tuple
+
+from app_broken import WEEK1_GAMES
+from odds_engine import BOOK_NAMES
+from season_simulator import build_schedule
+from team_data import TEAMS
+
+SIZES = (16, 272, 10_000)
+
+# ESPN payloads carry far more than the parser keeps; these stand in for it
+_ESPN_NOISE = {
+    'status': {'clock': 0.0, 'displayClock': '0:00', 'period': 0,
+               'type': {'id': '1', 'name': 'STATUS_SCHEDULED', 'state': 'pre', 'completed': False}},
+    'venue': {'id': '3622', 'fullName': 'Fixture Stadium', 'address': {'city': 'Fixture', 'state': 'NA'},
+              'indoor': False},
+    'broadcasts': [{'market': 'national', 'names': ['FOX']}],
+    'links': [{'rel': ['summary', 'desktop', 'event'], 'href': 'https://www.espn.com/nfl/game/_/gameId/0',
+               'text': 'Gamecast', 'isExternal': False, 'isPremium': False}] * 4,
+}
+
+
+def matchups(n_games: int) -> List[Tuple[str, str]]:
+    """``n_games`` distinct (away, home) pairs"""
+    if n_games <= len(WEEK1_GAMES):
+        return list(WEEK1_GAMES[:n_games])
+    schedule = build_schedule()
+    if n_games <= len(schedule):
+        return [(TEAMS.names[away], TEAMS.names[home]) for away, home in schedule[:n_games]]
+    return [(f"Fixture Team {2 * i}", f"Fixture Team {2 * i + 1}") for i in range(n_games)]
+
+
+def espn_scoreboard(n_games: int, seed: int = 0) -> bytes:
+    """ESPN scoreboard JSON with one competition and five providers per game"""
+    rng = random.Random(seed)
+    events = []
+    for i, (away, home) in enumerate(matchups(n_games)):
+        odds = []
+        for book in BOOK_NAMES:
+            spread = rng.choice([-7.5, -3.5, -3.0, -1.5, 1.5, 3.0, 6.5])
+            odds.append({
+                'provider': {'id': str(len(odds)), 'name': book, 'priority': 1},
+                'details': f"{home[:3].upper()} {spread:+.1f}",
+                'spread': spread,
+                'overUnder': rng.choice([41.5, 44.0, 47.5, 51.0]),
+                'overOdds': -110, 'underOdds': -110,
+                'homeTeamOdds': {'favorite': spread < 0, 'moneyLine': -150 if spread < 0 else 130,
+                                 'spreadOdds': -110, 'team': {'id': '1'}},
+                'awayTeamOdds': {'favorite': spread > 0, 'moneyLine': 130 if spread < 0 else -150,
+                                 'spreadOdds': -110, 'team': {'id': '2'}},
+            })
+        competitors = [
+            {'id': str(2 * i), 'homeAway': 'home', 'order': 0, 'records': [{'summary': '0-0'}] * 3,
+             'team': {'id': str(2 * i), 'displayName': home, 'abbreviation': home[:3].upper(),
+                      'logo': 'https://a.espncdn.com/i/teamlogos/nfl/500/fix.png', 'color': '000000'}},
+            {'id': str(2 * i + 1), 'homeAway': 'away', 'order': 1, 'records': [{'summary': '0-0'}] * 3,
+             'team': {'id': str(2 * i + 1), 'displayName': away, 'abbreviation': away[:3].upper(),
+                      'logo': 'https://a.espncdn.com/i/teamlogos/nfl/500/fix.png', 'color': 'ffffff'}},
+        ]
+        events.append({'id': str(i), 'name': f"{away} at {home}", 'date': '2025-09-07T17:00Z',
+                       'competitions': [{'id': str(i), 'competitors': competitors, 'odds': odds, **_ESPN_NOISE}],
+                       **_ESPN_NOISE})
+    return json.dumps({'leagues': [{'id': '28', 'name': 'National Football League'}], 'events': events}).encode()
+
+
+def scoreboard_html(n_games: int) -> str:
+    """Scoreboard page with one block of markup, script and team names per game"""
+    pairs = matchups(min(n_games, len(build_schedule())))
+    blocks = []
+    for i in range(n_games):
+        away, home = pairs[i % len(pairs)]
+        blocks.append(
+            f'<section class="Scoreboard" data-id="{i}"><div class="ScoreCell">'
+            f'<a href="/nfl/team/_/name/{away[:3].lower()}"><span class="ScoreCell__TeamName">{away}</span></a>'
+            f'<span class="ScoreCell__Record">(0-0)</span> at '
+            f'<a href="/nfl/team/_/name/{home[:3].lower()}"><span class="ScoreCell__TeamName">{home}</span></a>'
+            f'</div><script>window.__gamecast__ = {{"id": {i}, "tracking": true}};</script>'
+            f'<div class="Odds">Line: {home} -3.5 &middot; O/U 44.5</div></section>'
+        )
+    return f'<html><head><title>NFL Scoreboard</title></head><body>{"".join(blocks)}</body></html>'
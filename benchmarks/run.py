@@ -0,0 +1,158 @@
+"""Scaling benchmarks for the odds, prediction and parsing pipeline.
+
+Times each stage against fixture slates of 16, 272 and 10,000 games and
+records its peak traced memory. Results are compared with a stored baseline,
+and the run fails when a stage gets slower or bigger than the allowed
+tolerance.
+
+    python benchmarks/run.py                     # compare with benchmarks/baseline.json
+    python benchmarks/run.py --sizes 16 272      # quicker run
+    python benchmarks/run.py --update-baseline   # record this machine's numbers
+
+Baselines are machine-specific: record them on the machine that compares them.
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# The app imports in Streamlit's bare mode (it logs a few 'missing ScriptRunContext' warnings)
+import numpy as np  # noqa: E402
+
+import fixtures  # noqa: E402
+from app_broken import AIPredictor, LiveOddsScraper, find_best_odds  # noqa: E402
+from odds_store import OddsStore  # noqa: E402
+from prediction_cache import PredictionCache  # noqa: E402
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+TIME_TOLERANCE = 0.5  # fail when a stage is over 50% slower than its baseline
+MEMORY_TOLERANCE = 0.25
+MIN_SECONDS = 0.005  # stages faster than this are too noisy to fail on time
+BENCH_SIMS = 10_000  # simulations per game for the prediction stage
+
+
+def measure(stage: Callable[[], object], repeats: int) -> Dict[str, float]:
+    """Best wall time over ``repeats`` runs, then peak traced memory of one more run"""
+    best = float('inf')
+    for _ in range(repeats):
+        gc.collect()
+        started = time.perf_counter()
+        stage()
+        best = min(best, time.perf_counter() - started)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = stage()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'seconds': best, 'peak_mb': peak / 2 ** 20, 'items': len(result) if hasattr(result, '__len__') else 0}
+
+
+def pipeline_stages(n_games: int) -> Dict[str, Callable[[], object]]:
+    """Stage name -> zero-argument callable over this size's fixtures"""
+    scraper = LiveOddsScraper()
+    predictor = AIPredictor(n_sims=BENCH_SIMS)
+    matchups = fixtures.matchups(n_games)
+    odds = scraper.generate_ultra_realistic_odds(matchups)
+    games = list(odds.values())
+    espn = fixtures.espn_scoreboard(n_games)
+    html = fixtures.scoreboard_html(n_games)
+    spreads = np.linspace(-10, 10, n_games)
+    store = OddsStore.from_odds(odds)
+    digests = dict(zip(store.game_keys, store.game_digests().tolist()))
+    # The refresh worker's steady state: every game of the slate already cached
+    warm = AIPredictor(PredictionCache(max_entries=n_games), n_sims=BENCH_SIMS)
+    warm.cached_slate(odds, digests)
+
+    return {
+        'generate_ultra_realistic_odds': lambda: scraper.generate_ultra_realistic_odds(matchups),
+        'generate_sportsbook_variations': lambda: [
+            scraper.generate_sportsbook_variations(float(spread), 44.5, {}, {}) for spread in spreads],
+        'generate_predictions': lambda: [predictor.generate_predictions(game) for game in games],
+        'predict_slate': lambda: predictor.predict_slate(odds),
+        'cached_slate_cold': lambda: AIPredictor(PredictionCache(max_entries=n_games), n_sims=BENCH_SIMS)
+        .cached_slate(odds, digests),
+        'cached_slate_warm': lambda: warm.cached_slate(odds, digests),
+        'find_best_odds': lambda: find_best_odds(odds),
+        'parse_espn_api_data': lambda: scraper.parse_espn_api_data(espn),
+        'parse_fallback_data': lambda: scraper.parse_fallback_data(html, 'Benchmark'),
+    }
+
+
+def run(sizes: List[int], repeats: int) -> Dict[str, Dict[str, Dict[str, float]]]:
+    results = {}
+    for n_games in sizes:
+        results[str(n_games)] = {}
+        for name, stage in pipeline_stages(n_games).items():
+            # One repeat is plenty at the largest size
+            result = measure(stage, repeats if n_games < 10_000 else 1)
+            results[str(n_games)][name] = result
+            print(f"{n_games:>6} games  {name:<32} {1000 * result['seconds']:>10.1f} ms"
+                  f"  {result['peak_mb']:>8.1f} MB peak", flush=True)
+    return results
+
+
+def compare(results: Dict, baseline: Dict) -> List[str]:
+    """Human-readable regressions of ``results`` against ``baseline``"""
+    regressions = []
+    for size, stages in results.items():
+        for name, result in stages.items():
+            base = baseline.get(size, {}).get(name)
+            if base is None:
+                continue
+            if result['seconds'] > max(base['seconds'], MIN_SECONDS) * (1 + TIME_TOLERANCE):
+                regressions.append(f"{name} @ {size} games: {1000 * result['seconds']:.1f} ms "
+                                   f"vs baseline {1000 * base['seconds']:.1f} ms")
+            if result['peak_mb'] > max(base['peak_mb'], 1.0) * (1 + MEMORY_TOLERANCE):
+                regressions.append(f"{name} @ {size} games: {result['peak_mb']:.1f} MB peak "
+                                   f"vs baseline {base['peak_mb']:.1f} MB")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(fixtures.SIZES))
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--update-baseline', action='store_true', help="store these results as the new baseline")
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.repeats)
+
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(args.baseline, 'w') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline first")
+        return 1
+    with open(args.baseline) as f:
+        regressions = compare(results, json.load(f))
+    for regression in regressions:
+        print(f"REGRESSION: {regression}")
+    print("FAIL" if regressions else "OK")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""Import-time profile of the app's cold start.
+
+Runs a fresh interpreter with ``-X importtime`` that imports the app module
+(this executes the script body in Streamlit's bare mode, up to the first
+paint). It reports the total time, the cost of each top-level import, and the
+modules that are slowest on their own.
+
+    python benchmarks/startup.py                  # profile app_broken
+    python benchmarks/startup.py app --top 15
+
+When ``QWERK_PROFILE_STARTUP`` is set, start.sh prints this report before it
+launches Streamlit, so a fresh container logs its own cold-start cost.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from typing import Iterable, List, NamedTuple, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_MODULE = 'app_broken'
+DEFAULT_TOP = 20
+
+
+class ImportTiming(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int  # 0 for the profiled module and other top-level imports
+
+
+def parse_importtime(lines: Iterable[str]) -> List[ImportTiming]:
+    """Timings from ``-X importtime`` stderr; any other output is skipped"""
+    timings = []
+    for line in lines:
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the header row
+        name = fields[2].rstrip()
+        stripped = name.lstrip()
+        depth = (len(name) - len(stripped) - 1) // 2
+        timings.append(ImportTiming(stripped, int(fields[0]), int(fields[1]), depth))
+    return timings
+
+
+def profile_imports(module: str = DEFAULT_MODULE) -> Tuple[List[ImportTiming], float]:
+    """Import timings and wall seconds of ``import module`` in a fresh interpreter"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get('PYTHONPATH')])))
+    started = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    wall = time.perf_counter() - started
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr.splitlines()), wall
+
+
+def report(module: str, timings: List[ImportTiming], wall: float, top: int = DEFAULT_TOP) -> str:
+    """Top-level imports of ``module`` by cumulative cost, then the slowest modules by self time"""
+    lines = [f"Startup profile: import {module} took {1000 * wall:.0f} ms wall "
+             f"(interpreter start included)"]
+    # -X importtime lists a module after everything it imports, so its children precede it
+    own = next((i for i, timing in enumerate(timings) if timing.module == module and timing.depth == 0), None)
+    if own is not None:
+        lines.append(f"{module} import: {timings[own].cumulative_us / 1000:.0f} ms, "
+                     f"module body {timings[own].self_us / 1000:.0f} ms")
+        start = own
+        while start > 0 and timings[start - 1].depth > 0:
+            start -= 1
+        children = [timing for timing in timings[start:own] if timing.depth == 1]
+        lines.append("")
+        lines.append(f"{'ms':>8}  direct import of {module}")
+        for timing in sorted(children, key=lambda t: -t.cumulative_us)[:top]:
+            lines.append(f"{timing.cumulative_us / 1000:>8.1f}  {timing.module}")
+
+    lines.append("")
+    lines.append(f"{'self ms':>8}  module")
+    for timing in sorted(timings, key=lambda t: -t.self_us)[:top]:
+        lines.append(f"{timing.self_us / 1000:>8.1f}  {timing.module}")
+    return '\n'.join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('module', nargs='?', default=DEFAULT_MODULE)
+    parser.add_argument('--top', type=int, default=DEFAULT_TOP)
+    args = parser.parse_args(argv)
+
+    timings, wall = profile_imports(args.module)
+    print(report(args.module, timings, wall, args.top), flush=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
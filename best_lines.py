@@ -0,0 +1,151 @@
+"""Best available line and price per game and side across all sportsbooks.
+
+Spreads use the store's convention (the home team's expected margin, so a
+home bet wins when the margin beats the line): home bettors want the lowest
+spread, away bettors the highest; over bettors want the lowest total and
+under bettors the highest. Ties on the line go to the better price.
+"""
+
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+from odds_math import STANDARD_DECIMAL, american_to_decimal
+from odds_store import NO_PRICE, OddsStore
+
+# side -> (line column or None, price column, line direction: +1 higher is better, -1 lower)
+SIDES = {
+    'spread_home': ('spread', 'spread_price_home', -1),
+    'spread_away': ('spread', 'spread_price_away', +1),
+    'total_over': ('total', 'over_price', -1),
+    'total_under': ('total', 'under_price', +1),
+    'ml_home': (None, 'moneyline_home', +1),
+    'ml_away': (None, 'moneyline_away', +1),
+}
+
+# A half point of line is worth more than any price difference
+_LINE_WEIGHT = 1000.0
+
+def side_decimal(side: str, prices: np.ndarray) -> np.ndarray:
+    """Decimal odds for one side's quotes; unpriced spread/total quotes count as standard -110"""
+    decimal = american_to_decimal(prices)
+    if SIDES[side][0] is not None:
+        decimal = np.where(np.isnan(decimal), STANDARD_DECIMAL, decimal)
+    return decimal
+
+
+def _side_keys(store: OddsStore, side: str, rows: np.ndarray) -> np.ndarray:
+    """Sortable 'how good is this quote' key per row; -inf if unusable"""
+    line_column, price_column, direction = SIDES[side]
+    key = side_decimal(side, store.column(price_column)[rows])
+    if line_column is not None:
+        key = key + direction * store.column(line_column)[rows].astype(float) * _LINE_WEIGHT
+    return np.where(np.isnan(key), -np.inf, key)
+
+
+def _grouped_argmax(groups: np.ndarray, keys: np.ndarray, n_groups: int) -> np.ndarray:
+    """Index of the max key within each group (the first on ties, like argmax); -1 for groups with no usable key"""
+    best = np.full(n_groups, -1, dtype=np.int64)
+    if len(keys) == 0:
+        return best
+    order = np.lexsort((-np.arange(len(keys)), keys, groups))
+    sorted_groups = groups[order]
+    last = np.r_[np.flatnonzero(np.diff(sorted_groups)), len(order) - 1]
+    winners = order[last]
+    valid = np.isfinite(keys[winners])
+    best[sorted_groups[last][valid]] = winners[valid]
+    return best
+
+
+class BestLines:
+    """Best row per (game, side), rescanned one game at a time as quotes change"""
+
+    def __init__(self, store: OddsStore):
+        self.store = store
+        self.best: Dict[str, np.ndarray] = {}
+        self.recompute()
+
+    @classmethod
+    def carry_over(cls, previous: 'BestLines', store: OddsStore, dirty_games: Iterable[int]) -> 'BestLines':
+        """Best lines for a new store, reusing ``previous`` for every game not in ``dirty_games``.
+
+        Clean games must have the same quotes in both stores (e.g. equal game
+        digests); their best rows are remapped by (game key, book) and only
+        the dirty games are rescanned.
+        """
+        best_lines = cls.__new__(cls)
+        best_lines.store = store
+        best_lines.best = {}
+
+        prev_store = previous.store
+        game_map = np.array([-1 if store.game_index(key) is None else store.game_index(key)
+                             for key in prev_store.game_keys], dtype=np.int64)
+        book_map = np.array([store.books.ids.get(name, -1) for name in prev_store.books.names] or [-1],
+                            dtype=np.int64)
+        table = store.row_table()
+        for side, prev_best in previous.best.items():
+            best = np.full(store.n_games, -1, dtype=np.int64)
+            prev_games = np.flatnonzero((prev_best >= 0) & (game_map >= 0))
+            new_games = game_map[prev_games]
+            new_books = book_map[prev_store.column('book')[prev_best[prev_games]]]
+            keep = new_books >= 0
+            best[new_games[keep]] = table[new_games[keep], new_books[keep]]
+            best_lines.best[side] = best
+
+        for game in dirty_games:
+            best_lines.update_game(game)
+        return best_lines
+
+    def recompute(self):
+        """Full vectorized pass over every quote in the store"""
+        rows = np.arange(len(self.store))
+        games = self.store.column('game')
+        for side in SIDES:
+            self.best[side] = _grouped_argmax(games, _side_keys(self.store, side, rows), self.store.n_games)
+
+    def _ensure_games(self):
+        n_games = self.store.n_games
+        for side, best in self.best.items():
+            if len(best) < n_games:
+                self.best[side] = np.concatenate([best, np.full(n_games - len(best), -1, dtype=np.int64)])
+
+    def update_game(self, game: int):
+        """Recompute one game's best lines from its own rows only"""
+        self._ensure_games()
+        rows = self.store.game_rows(game)
+        for side in SIDES:
+            keys = _side_keys(self.store, side, rows)
+            if len(keys) and np.isfinite(keys.max()):
+                self.best[side][game] = rows[int(np.argmax(keys))]
+            else:
+                self.best[side][game] = -1
+
+    def best_quote(self, game: int, side: str) -> Optional[Dict]:
+        """{'line', 'price', 'book'} for one game and side, or None"""
+        row = self.best[side][game]
+        if row < 0:
+            return None
+        line_column, price_column, _ = SIDES[side]
+        price = int(self.store.column(price_column)[row])
+        return {
+            'line': round(float(self.store.column(line_column)[row]), 2) if line_column else None,
+            'price': price if price != NO_PRICE else None,
+            'book': self.store.books.names[self.store.column('book')[row]],
+        }
+
+    def frame(self):
+        """One row per game with the best line, price and book for every side"""
+        import pandas as pd
+
+        columns = {'game': self.store.game_keys}
+        for side, (line_column, price_column, _) in SIDES.items():
+            rows = self.best[side][:self.store.n_games]
+            found = rows >= 0
+            safe = np.where(found, rows, 0)
+            if line_column is not None:
+                columns[f'{side}_line'] = np.where(found, self.store.column(line_column)[safe], np.nan) if len(safe) else []
+            prices = self.store.column(price_column)[safe].astype(float) if len(safe) else np.array([])
+            columns[f'{side}_price'] = np.where(found & (prices != NO_PRICE), prices, np.nan) if len(safe) else []
+            books = np.asarray(self.store.books.names, dtype=object)
+            columns[f'{side}_book'] = np.where(found, books[self.store.column('book')[safe]], None) if len(safe) else []
+        return pd.DataFrame(columns)
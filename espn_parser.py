@@ -0,0 +1,178 @@
+"""Schema-projected parser for ESPN scoreboard JSON.
+
+Only the fields the app uses are kept: each competition's competitors (side
+and display name) and, per odds provider, the spread, total and prices.
+With ``ijson`` (in requirements.txt) the payload is decoded incrementally as
+a stream of events and nothing outside the projection is ever materialized;
+without it, the standard decoder drops every other key as soon as its object
+is built. Both paths yield the same typed records, which load straight
+into an :class:`OddsStore` (see :meth:`OddsStore.upsert_quotes`).
+"""
+
+import io
+import json
+import math
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from odds_store import parse_line, parse_price
+
+try:
+    import ijson
+except ImportError:  # optional: fall back to the projected json decoder
+    ijson = None
+
+_COMPETITION = 'events.item.competitions.item'
+_COMPETITOR = _COMPETITION + '.competitors.item'
+_ODDS = _COMPETITION + '.odds.item'
+
+# Path under competitors.item -> kept field
+_COMPETITOR_FIELDS = {'homeAway': 'side', 'team.displayName': 'name'}
+
+# Path under odds.item -> kept field
+_ODDS_FIELDS = {
+    'provider.name': 'book',
+    'spread': 'spread',
+    'overUnder': 'total',
+    'overOdds': 'over_price',
+    'underOdds': 'under_price',
+    'homeTeamOdds.spreadOdds': 'spread_price_home',
+    'awayTeamOdds.spreadOdds': 'spread_price_away',
+    'homeTeamOdds.moneyLine': 'moneyline_home',
+    'awayTeamOdds.moneyLine': 'moneyline_away',
+}
+
+# Every key on a kept path, for the non-streaming fallback
+_KEEP_KEYS = frozenset({'events', 'competitions', 'competitors', 'odds'}
+                       | {part for path in list(_COMPETITOR_FIELDS) + list(_ODDS_FIELDS) for part in path.split('.')})
+
+_SCALAR_EVENTS = frozenset({'string', 'number', 'boolean', 'null'})
+
+
+class QuoteRecord(NamedTuple):
+    """One provider's quote in the store's convention (positive spread = home favored)"""
+    book: str
+    spread: float
+    spread_price_home: int
+    spread_price_away: int
+    total: float
+    over_price: int
+    under_price: int
+    moneyline_home: int
+    moneyline_away: int
+
+
+class GameRecord(NamedTuple):
+    away_team: str
+    home_team: str
+    quotes: Tuple[QuoteRecord, ...]
+
+
+def _quote_record(odds: Dict) -> Optional[QuoteRecord]:
+    book = odds.get('book')
+    if not book:
+        return None
+    # ESPN quotes the home team's line (-3.5 = home gives 3.5); the store keeps the home margin
+    spread, _ = parse_line(odds.get('spread'))
+    total, _ = parse_line(odds.get('total'))
+    return QuoteRecord(
+        book=str(book),
+        spread=-spread if not math.isnan(spread) else spread,
+        spread_price_home=parse_price(odds.get('spread_price_home')),
+        spread_price_away=parse_price(odds.get('spread_price_away')),
+        total=total,
+        over_price=parse_price(odds.get('over_price')),
+        under_price=parse_price(odds.get('under_price')),
+        moneyline_home=parse_price(odds.get('moneyline_home')),
+        moneyline_away=parse_price(odds.get('moneyline_away')),
+    )
+
+
+def _game_record(competitors: List[Dict], odds: List[Dict]) -> Optional[GameRecord]:
+    if len(competitors) < 2:
+        return None
+    sides = {c.get('side'): c.get('name') for c in competitors}
+    # ESPN lists the home team first when homeAway is missing
+    home_team = sides.get('home') or competitors[0].get('name')
+    away_team = sides.get('away') or competitors[1].get('name')
+    if not home_team or not away_team:
+        return None
+    quotes = tuple(quote for quote in map(_quote_record, odds) if quote is not None)
+    return GameRecord(str(away_team), str(home_team), quotes)
+
+
+def _stream_records(stream) -> Iterator[GameRecord]:
+    """Incremental projection over ijson parse events"""
+    competitors = odds = None
+    current = None
+    for prefix, event, value in ijson.parse(stream, use_float=True):
+        if prefix == _COMPETITION:
+            if event == 'start_map':
+                competitors, odds = [], []
+            elif event == 'end_map' and competitors is not None:
+                record = _game_record(competitors, odds)
+                if record is not None:
+                    yield record
+                competitors = odds = None
+        elif competitors is None:
+            continue
+        elif prefix == _COMPETITOR or prefix == _ODDS:
+            if event == 'start_map':
+                current = {}
+            elif event == 'end_map':
+                (competitors if prefix == _COMPETITOR else odds).append(current)
+                current = None
+        elif current is not None and event in _SCALAR_EVENTS:
+            if prefix.startswith(_COMPETITOR + '.'):
+                field = _COMPETITOR_FIELDS.get(prefix[len(_COMPETITOR) + 1:])
+            elif prefix.startswith(_ODDS + '.'):
+                field = _ODDS_FIELDS.get(prefix[len(_ODDS) + 1:])
+            else:
+                field = None
+            if field is not None:
+                current[field] = value
+
+
+def _project(pairs: List[Tuple[str, object]]) -> Dict:
+    return {key: value for key, value in pairs if key in _KEEP_KEYS}
+
+
+def _dig(obj, path: str):
+    for part in path.split('.'):
+        if not isinstance(obj, dict):
+            return None
+        obj = obj.get(part)
+    return obj
+
+
+def _projected_records(payload: bytes) -> Iterator[GameRecord]:
+    """Fallback: standard decoder that keeps only keys on the projection"""
+    data = json.loads(payload, object_pairs_hook=_project)
+    for event in data.get('events') or []:
+        for competition in event.get('competitions') or []:
+            competitors = [{field: _dig(c, path) for path, field in _COMPETITOR_FIELDS.items()}
+                           for c in competition.get('competitors') or []]
+            odds = [{field: _dig(o, path) for path, field in _ODDS_FIELDS.items()}
+                    for o in competition.get('odds') or []]
+            record = _game_record(competitors, odds)
+            if record is not None:
+                yield record
+
+
+def parse_scoreboard(payload: Union[bytes, io.IOBase]) -> List[GameRecord]:
+    """Game records from an ESPN scoreboard payload (bytes or a binary file-like)"""
+    if ijson is not None:
+        stream = io.BytesIO(payload) if isinstance(payload, (bytes, bytearray)) else payload
+        return list(_stream_records(stream))
+    if not isinstance(payload, (bytes, bytearray)):
+        payload = payload.read()
+    return list(_projected_records(payload))
+
+
+def sportsbooks_dict(record: GameRecord) -> Dict[str, Dict]:
+    """A record's quotes in the fetchers' per-book dict shape"""
+    sportsbooks = {}
+    for quote in record.quotes:
+        values = quote._asdict()
+        sportsbooks[values.pop('book')] = values
+    return sportsbooks
+
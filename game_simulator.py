@@ -0,0 +1,140 @@
+"""Vectorized Monte Carlo game simulator.
+
+Each team's score is drawn from a normal distribution whose mean comes from
+the registry ratings through the odds engine's scoring model: power rating
+(plus home field) and recent form set the expected margin, and the two
+offenses set the expected total, so simulated totals centre on the books'.
+Scores are rounded to whole points, so integer lines can push. Draws are
+made in (games, sims) NumPy batches and reduced to per-game histograms of
+margin and total. Cover, over/under and win probabilities against any
+book's line are then read off the cumulative counts.
+"""
+
+from typing import Dict, Sequence, Tuple, Union
+
+import numpy as np
+
+from odds_engine import expected_margin, expected_total
+from team_data import DEFAULT_OFF_RATING, DEFAULT_POWER_RATING, DEFAULT_RECENT_FORM, TEAMS
+
+DEFAULT_SIMS = 200_000
+CHUNK_SIMS = 50_000
+
+SCORE_SD = 9.5  # per team; margin and total SD come out near 13.5
+FORM_WEIGHT = 4.0  # points of margin per 1.0 of recent-form difference
+
+# Histogram ranges: margins in [-MAX_MARGIN, MAX_MARGIN], totals in [0, MAX_TOTAL]
+MAX_MARGIN = 100
+MAX_TOTAL = 200
+
+# Registry rating -> value assumed for unknown teams
+_RATINGS = {
+    'power_rating': DEFAULT_POWER_RATING,
+    'off_rating': DEFAULT_OFF_RATING,
+    'recent_form': DEFAULT_RECENT_FORM,
+}
+
+
+def score_means(away_teams: Sequence[str], home_teams: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Expected (away, home) points per game from the team registry"""
+    away = {name: TEAMS.ratings(away_teams, name, default) for name, default in _RATINGS.items()}
+    home = {name: TEAMS.ratings(home_teams, name, default) for name, default in _RATINGS.items()}
+    margin = (expected_margin(away['power_rating'], home['power_rating'])
+              + FORM_WEIGHT * (home['recent_form'] - away['recent_form']))
+    total = expected_total(away['off_rating'], home['off_rating'])
+    return (total - margin) / 2, (total + margin) / 2
+
+
+class ScoreDistribution:
+    """Per-game histograms of simulated margin (home - away) and total points"""
+
+    def __init__(self, margin_counts: np.ndarray, total_counts: np.ndarray, n_sims: int):
+        self.margin_counts = margin_counts
+        self.total_counts = total_counts
+        self.n_sims = n_sims
+        self._margin_cdf = np.cumsum(margin_counts, axis=1) / n_sims
+        self._total_cdf = np.cumsum(total_counts, axis=1) / n_sims
+
+    @property
+    def n_games(self) -> int:
+        return len(self.margin_counts)
+
+    def _above(self, cdf: np.ndarray, counts: np.ndarray, offset: int,
+               lines: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """P(value > line), P(value == line), P(value < line) for (games, books) lines"""
+        lines = np.asarray(lines, dtype=float)
+        if lines.ndim == 1:
+            lines = lines[:, None]
+        missing = np.isnan(lines)
+        safe = np.where(missing, 0.0, lines)
+        rows = np.arange(self.n_games)[:, None]
+        width = cdf.shape[1]
+
+        floor = np.floor(safe).astype(np.int64) + offset
+        at_or_below = np.where(floor < 0, 0.0, cdf[rows, np.clip(floor, 0, width - 1)])
+        on_line = (safe == np.floor(safe)) & (floor >= 0) & (floor < width)
+        push = np.where(on_line, counts[rows, np.clip(floor, 0, width - 1)] / self.n_sims, 0.0)
+
+        above = 1 - at_or_below
+        below = at_or_below - push
+        return tuple(np.where(missing, np.nan, p) for p in (above, push, below))
+
+    def spread_probabilities(self, spreads: np.ndarray) -> Dict[str, np.ndarray]:
+        """Home cover / push / away cover per game and line (spread = home margin line)"""
+        above, push, below = self._above(self._margin_cdf, self.margin_counts, MAX_MARGIN, spreads)
+        return {'home_cover': above, 'spread_push': push, 'away_cover': below}
+
+    def total_probabilities(self, totals: np.ndarray) -> Dict[str, np.ndarray]:
+        """Over / push / under per game and line"""
+        above, push, below = self._above(self._total_cdf, self.total_counts, 0, totals)
+        return {'over': above, 'total_push': push, 'under': below}
+
+    def win_probabilities(self) -> Dict[str, np.ndarray]:
+        """Home / away win per game; regulation ties are split evenly (overtime)"""
+        above, push, below = self._above(self._margin_cdf, self.margin_counts, MAX_MARGIN, np.zeros(self.n_games))
+        return {'home_win': (above + push / 2)[:, 0], 'away_win': (below + push / 2)[:, 0]}
+
+    def mean_total(self) -> np.ndarray:
+        return self.total_counts @ np.arange(self.total_counts.shape[1]) / self.n_sims
+
+
+def simulate_slate(away_mean: np.ndarray, home_mean: np.ndarray, n_sims: int = DEFAULT_SIMS,
+                   rng: Union[None, np.random.Generator, Sequence[np.random.Generator]] = None,
+                   chunk: int = CHUNK_SIMS) -> ScoreDistribution:
+    """Simulate every game ``n_sims`` times in (games, chunk) batches.
+
+    ``rng`` may be one generator for the whole slate or one per game, which
+    keeps each game's results independent of the rest of the slate.
+    """
+    away_mean = np.asarray(away_mean, dtype=float)
+    home_mean = np.asarray(home_mean, dtype=float)
+    n_games = len(away_mean)
+    per_game = isinstance(rng, (list, tuple))
+    if not per_game:
+        rng = rng or np.random.default_rng()
+
+    margin_width = 2 * MAX_MARGIN + 1
+    total_width = MAX_TOTAL + 1
+    margin_counts = np.zeros(n_games * margin_width, dtype=np.int64)
+    total_counts = np.zeros(n_games * total_width, dtype=np.int64)
+    game_rows = np.arange(n_games)[:, None]
+
+    done = 0
+    while done < n_sims:
+        size = min(chunk, n_sims - done)
+        if per_game:
+            noise = np.stack([game_rng.standard_normal((2, size)) for game_rng in rng], axis=1)
+        else:
+            noise = rng.standard_normal((2, n_games, size))
+        away = np.maximum(np.rint(away_mean[:, None] + SCORE_SD * noise[0]), 0).astype(np.int64)
+        home = np.maximum(np.rint(home_mean[:, None] + SCORE_SD * noise[1]), 0).astype(np.int64)
+
+        margin = np.clip(home - away, -MAX_MARGIN, MAX_MARGIN) + MAX_MARGIN
+        total = np.minimum(home + away, MAX_TOTAL)
+        margin_counts += np.bincount((game_rows * margin_width + margin).ravel(), minlength=margin_counts.size)
+        total_counts += np.bincount((game_rows * total_width + total).ravel(), minlength=total_counts.size)
+        done += size
+
+    return ScoreDistribution(margin_counts.reshape(n_games, margin_width),
+                             total_counts.reshape(n_games, total_width), n_sims)
+
@@ -0,0 +1,161 @@
+"""Shared, connection-pooled HTTP client for every odds source.
+
+One keep-alive session is reused for all hosts (site.api.espn.com,
+api.the-odds-api.com, ...), responses carrying ETag/Last-Modified are
+revalidated with conditional GETs, and retries are bounded both per request
+and globally by a retry budget.
+"""
+
+import copy
+import random
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Status codes worth retrying; everything else is returned to the caller as-is
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RETRY_EXCEPTIONS = (requests.ConnectionError, requests.Timeout)
+
+
+class RetryBudget:
+    """Token bucket that caps retries at a fraction of overall request volume"""
+
+    def __init__(self, ratio: float = 0.2, initial_tokens: float = 5.0, max_tokens: float = 10.0):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = initial_tokens
+        self._lock = threading.Lock()
+
+    def record_request(self):
+        """Earn a fraction of a retry for every first attempt"""
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        """Take one retry token if available"""
+        with self._lock:
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return True
+            return False
+
+
+class PooledHttpClient:
+    """Keep-alive session with conditional GETs and jittered, budgeted retries"""
+
+    def __init__(self, pool_connections: int = 16, pool_maxsize: int = 8,
+                 max_retries: int = 2, backoff_base: float = 0.25, backoff_cap: float = 2.0,
+                 budget: Optional[RetryBudget] = None, cache_size: int = 64):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.budget = budget or RetryBudget()
+        self.cache_size = cache_size
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # (url, params) -> last 200 response that carried a validator
+        self._validated: "OrderedDict[Tuple, requests.Response]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _cache_key(url: str, params: Optional[Dict]) -> Tuple:
+        return (url, tuple(sorted((params or {}).items())))
+
+    def _cached(self, key: Tuple) -> Optional[requests.Response]:
+        with self._lock:
+            response = self._validated.get(key)
+            if response is not None:
+                self._validated.move_to_end(key)
+            return response
+
+    def _store(self, key: Tuple, response: requests.Response):
+        if not (response.headers.get('ETag') or response.headers.get('Last-Modified')):
+            return
+        with self._lock:
+            self._validated[key] = response
+            self._validated.move_to_end(key)
+            while len(self._validated) > self.cache_size:
+                self._validated.popitem(last=False)
+
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff"""
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * (2 ** attempt)))
+
+    def get(self, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None,
+            timeout: float = 10, revalidate: bool = True) -> requests.Response:
+        """GET ``url`` within ``timeout`` seconds overall, including retries.
+
+        A 304 Not Modified is answered with a copy of the previously downloaded
+        response, which has ``from_cache`` set to True.
+        """
+        key = self._cache_key(url, params)
+        request_headers = dict(headers or {})
+        cached = self._cached(key) if revalidate else None
+        if cached is not None:
+            if cached.headers.get('ETag'):
+                request_headers['If-None-Match'] = cached.headers['ETag']
+            if cached.headers.get('Last-Modified'):
+                request_headers['If-Modified-Since'] = cached.headers['Last-Modified']
+
+        deadline = time.monotonic() + timeout
+        self.budget.record_request()
+        attempt = 0
+        while True:
+            remaining = deadline - time.monotonic()
+            try:
+                response = self.session.get(url, params=params, headers=request_headers,
+                                            timeout=max(remaining, 0.1))
+            except RETRY_EXCEPTIONS:
+                if not self._may_retry(attempt, deadline):
+                    raise
+            else:
+                if response.status_code == 304 and cached is not None:
+                    # A copy per caller: the cached response is shared across threads and never mutated
+                    served = copy.copy(cached)
+                    served.from_cache = True
+                    return served
+                if response.status_code not in RETRY_STATUSES or not self._may_retry(attempt, deadline):
+                    response.from_cache = False
+                    if response.status_code == 200 and revalidate:
+                        self._store(key, response)
+                    return response
+                response.close()
+
+            attempt += 1
+
+    def _may_retry(self, attempt: int, deadline: float) -> bool:
+        """Sleep before the next attempt if retry limits and the deadline allow one"""
+        if attempt >= self.max_retries:
+            return False
+        delay = self._backoff(attempt)
+        if time.monotonic() + delay >= deadline:
+            return False
+        if not self.budget.try_spend():
+            return False
+        time.sleep(delay)
+        return True
+
+    def close(self):
+        self.session.close()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> PooledHttpClient:
+    """Process-wide client shared by all fetchers"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = PooledHttpClient()
+    return _client
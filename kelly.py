@@ -0,0 +1,111 @@
+"""Simultaneous Kelly staking across a slate of markets.
+
+Bets are grouped into same-game blocks of up to three markets (spread,
+total, moneyline). Within a game the returns are correlated, and across
+games they are independent, so the covariance is block-diagonal. Stakes
+maximize the second-order Kelly growth ``f·mu - f'Σf/2`` per block with
+batched 3x3 solves. Negative stakes are dropped by an active set. A
+per-portfolio bankroll cap is enforced with one shared multiplier per
+portfolio, found by bisection, so re-optimizing hundreds of markets is a
+few dozen vectorized solves.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+# Block slots
+SPREAD, TOTAL, MONEYLINE = 0, 1, 2
+MARKET_SLOTS = 3
+
+# Correlation of same-game returns when both bets are on the same team; opposite teams flip the sign
+SPREAD_MONEYLINE_CORRELATION = 0.75
+
+KELLY_FRACTION = 0.25  # quarter Kelly
+BANKROLL_CAP = 0.25  # most of the bankroll a portfolio may stake at once
+
+_RIDGE = 1e-9
+_BISECTION_STEPS = 40
+
+
+def bet_moments(p_win: np.ndarray, p_push: np.ndarray, decimal: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Expected return and variance per unit staked (a push returns the stake)"""
+    p_win = np.asarray(p_win, dtype=float)
+    p_push = np.asarray(p_push, dtype=float)
+    net = np.asarray(decimal, dtype=float) - 1
+    p_loss = np.clip(1 - p_win - p_push, 0, 1)
+    mean = p_win * net - p_loss
+    variance = p_win * net ** 2 + p_loss - mean ** 2
+    return mean, np.maximum(variance, 0)
+
+
+def same_game_covariance(variance: np.ndarray, home_side: np.ndarray) -> np.ndarray:
+    """(blocks, 3, 3) return covariance from per-slot variances.
+
+    ``home_side`` is True where the slot's bet is on the home team (spread and
+    moneyline slots); totals are treated as independent of the sides.
+    """
+    sd = np.sqrt(variance)
+    same_team = np.where(home_side[:, SPREAD] == home_side[:, MONEYLINE], 1.0, -1.0)
+    cov = np.zeros(variance.shape + (MARKET_SLOTS,))
+    slots = np.arange(MARKET_SLOTS)
+    cov[:, slots, slots] = variance + _RIDGE
+    cross = SPREAD_MONEYLINE_CORRELATION * same_team * sd[:, SPREAD] * sd[:, MONEYLINE]
+    cov[:, SPREAD, MONEYLINE] = cross
+    cov[:, MONEYLINE, SPREAD] = cross
+    return cov
+
+
+def _solve_active(cov: np.ndarray, rhs: np.ndarray, active: np.ndarray) -> np.ndarray:
+    """Batched Σ_active⁻¹ rhs_active, zero for inactive slots"""
+    both = active[:, :, None] & active[:, None, :]
+    matrix = np.where(both, cov, np.eye(cov.shape[-1]))
+    stakes = np.linalg.solve(matrix, np.where(active, rhs, 0.0)[..., None])[..., 0]
+    return np.where(active, stakes, 0.0)
+
+
+def _stakes_at(cov: np.ndarray, mean: np.ndarray, penalty: np.ndarray) -> np.ndarray:
+    """Unit Kelly stakes with each block's returns reduced by its portfolio's budget penalty"""
+    rhs = mean - penalty[:, None]
+    active = rhs > 0
+    stakes = np.zeros_like(rhs)
+    for _ in range(rhs.shape[1]):
+        stakes = _solve_active(cov, rhs, active)
+        dropped = active & (stakes <= 0)
+        if not dropped.any():
+            break
+        active &= ~dropped
+    return np.maximum(stakes, 0.0)
+
+
+def simultaneous_kelly(mean: np.ndarray, cov: np.ndarray, portfolio: Optional[np.ndarray] = None,
+                       cap: float = BANKROLL_CAP, fraction: float = KELLY_FRACTION) -> np.ndarray:
+    """Bankroll fraction per (block, slot).
+
+    ``mean`` is (blocks, slots) expected return per unit, NaN or <= 0 for no
+    bet; ``cov`` the (blocks, slots, slots) covariance. Blocks sharing a
+    ``portfolio`` id share one bankroll whose total stake is capped at ``cap``.
+    """
+    mean = np.where(np.isfinite(mean), mean, -1.0)
+    n_blocks = len(mean)
+    portfolio = np.zeros(n_blocks, dtype=np.int64) if portfolio is None else np.asarray(portfolio, dtype=np.int64)
+    n_portfolios = int(portfolio.max()) + 1 if n_blocks else 0
+    if n_blocks == 0:
+        return np.zeros_like(mean)
+
+    def totals(stakes):
+        return np.bincount(portfolio, weights=fraction * stakes.sum(axis=1), minlength=n_portfolios)
+
+    stakes = _stakes_at(cov, mean, np.zeros(n_blocks))
+    over = totals(stakes) > cap
+    if over.any():
+        # Bisect each over-budget portfolio's penalty until its stakes fit the cap
+        low = np.zeros(n_portfolios)
+        high = np.where(over, max(float(mean.max()), 0.0), 0.0)
+        for _ in range(_BISECTION_STEPS):
+            middle = (low + high) / 2
+            fits = totals(_stakes_at(cov, mean, middle[portfolio])) <= cap
+            high = np.where(over & fits, middle, high)
+            low = np.where(over & ~fits, middle, low)
+        stakes = _stakes_at(cov, mean, high[portfolio])
+    return fraction * stakes
@@ -0,0 +1,176 @@
+"""Append-only line-movement history in memory-mapped ring buffers.
+
+Each (game, book) market gets a fixed-size ring file on local disk. Appends
+are O(1) writes into the mapping, reads of a time window are zero-copy views,
+and the history survives restarts without living on the Python heap.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import List, Optional
+
+import numpy as np
+
+from odds_store import NO_PRICE, OddsStore
+
+DEFAULT_HISTORY_DIR = os.environ.get('QWERK_HISTORY_DIR', os.path.expanduser('~/.qwerk/line_history'))
+DEFAULT_CAPACITY = 16384  # ticks per market; ~460 KB per ring file
+
+TICK_DTYPE = np.dtype([
+    ('ts', '<f8'),
+    ('spread', '<f4'),
+    ('total', '<f4'),
+    ('spread_price_home', '<i2'),
+    ('spread_price_away', '<i2'),
+    ('over_price', '<i2'),
+    ('under_price', '<i2'),
+    ('moneyline_home', '<i2'),
+    ('moneyline_away', '<i2'),
+])
+QUOTE_FIELDS = TICK_DTYPE.names[1:]
+
+_HEADER_DTYPE = np.dtype([('magic', 'S8'), ('capacity', '<u8'), ('written', '<u8')])
+_HEADER_SIZE = 64
+_MAGIC = b'QWRKRNG1'
+
+
+class TickRing:
+    """Fixed-capacity ring of ticks backed by one memory-mapped file"""
+
+    def __init__(self, path: str, capacity: int = DEFAULT_CAPACITY):
+        exists = os.path.exists(path)
+        if not exists:
+            with open(path, 'wb') as f:
+                f.truncate(_HEADER_SIZE + capacity * TICK_DTYPE.itemsize)
+
+        self.path = path
+        self._header = np.memmap(path, dtype=_HEADER_DTYPE, mode='r+', shape=(1,))
+        if exists and self._header['magic'][0] == _MAGIC:
+            capacity = int(self._header['capacity'][0])
+        else:
+            self._header['magic'] = _MAGIC
+            self._header['capacity'] = capacity
+            self._header['written'] = 0
+        self.capacity = capacity
+        self._ticks = np.memmap(path, dtype=TICK_DTYPE, mode='r+', offset=_HEADER_SIZE, shape=(capacity,))
+
+    @property
+    def written(self) -> int:
+        """Total ticks ever appended (the ring keeps the last ``capacity``)"""
+        return int(self._header['written'][0])
+
+    def __len__(self) -> int:
+        return min(self.written, self.capacity)
+
+    def append(self, tick: np.void):
+        """O(1): write the tick, then publish it by bumping the counter"""
+        written = self.written
+        self._ticks[written % self.capacity] = tick
+        self._header['written'] = written + 1
+
+    def last(self) -> Optional[np.void]:
+        written = self.written
+        return self._ticks[(written - 1) % self.capacity] if written else None
+
+    def segments(self) -> List[np.ndarray]:
+        """Stored ticks oldest-first as at most two views into the mapping"""
+        written = self.written
+        if written <= self.capacity:
+            return [self._ticks[:written]]
+        head = written % self.capacity
+        return [self._ticks[head:], self._ticks[:head]]
+
+    def window(self, start: float, end: float) -> List[np.ndarray]:
+        """Zero-copy views of the ticks with start <= ts < end, oldest first"""
+        views = []
+        for segment in self.segments():
+            ts = segment['ts']
+            lo, hi = np.searchsorted(ts, start, side='left'), np.searchsorted(ts, end, side='left')
+            if hi > lo:
+                views.append(segment[lo:hi])
+        return views
+
+    def flush(self):
+        self._ticks.flush()
+        self._header.flush()
+
+
+class LineHistory:
+    """Per-game, per-book tick rings under one directory"""
+
+    def __init__(self, directory: str = DEFAULT_HISTORY_DIR, capacity: int = DEFAULT_CAPACITY,
+                 max_open: int = 512):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.capacity = capacity
+        self.max_open = max_open
+        self._rings: "OrderedDict[str, TickRing]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _path(self, game_key: str, book: str) -> str:
+        digest = hashlib.sha1(f"{game_key}|{book}".encode('utf-8')).hexdigest()[:20]
+        return os.path.join(self.directory, f"{digest}.ring")
+
+    def ring(self, game_key: str, book: str) -> TickRing:
+        """Open (or create) the ring for one market, keeping at most ``max_open`` mapped"""
+        path = self._path(game_key, book)
+        with self._lock:
+            ring = self._rings.get(path)
+            if ring is None:
+                ring = TickRing(path, self.capacity)
+                self._rings[path] = ring
+                while len(self._rings) > self.max_open:
+                    self._rings.popitem(last=False)[1].flush()
+            else:
+                self._rings.move_to_end(path)
+            return ring
+
+    def record_store(self, store: OddsStore, changed_only: bool = True) -> int:
+        """Append one tick per (game, book) row of the store; returns ticks written"""
+        ticks = np.zeros(len(store), dtype=TICK_DTYPE)
+        ticks['ts'] = store.column('updated_at')
+        for field in QUOTE_FIELDS:
+            ticks[field] = store.column(field)
+
+        games = store.column('game')
+        books = store.column('book')
+        appended = 0
+        for row in range(len(store)):
+            ring = self.ring(store.game_keys[games[row]], store.books.names[books[row]])
+            last = ring.last()
+            if changed_only and last is not None and _same_quote(last, ticks[row]):
+                continue
+            ring.append(ticks[row])
+            appended += 1
+        return appended
+
+    def window(self, game_key: str, book: str, start: float, end: float) -> List[np.ndarray]:
+        return self.ring(game_key, book).window(start, end)
+
+    def flush(self):
+        with self._lock:
+            for ring in self._rings.values():
+                ring.flush()
+
+
+def _same_quote(a: np.void, b: np.void) -> bool:
+    for field in QUOTE_FIELDS:
+        x, y = a[field], b[field]
+        if x != y and not (x != x and y != y):  # NaN == NaN for missing lines
+            return False
+    return True
+
+
+def ticks_frame(views: List[np.ndarray]):
+    """Materialize window views as a DataFrame (this is where the copy happens)"""
+    import pandas as pd
+
+    ticks = np.concatenate(views) if views else np.zeros(0, dtype=TICK_DTYPE)
+    frame = pd.DataFrame(ticks)
+    for field in QUOTE_FIELDS:
+        if field not in ('spread', 'total'):
+            frame[field] = frame[field].where(frame[field] != NO_PRICE)
+    frame['ts'] = pd.to_datetime(frame['ts'], unit='s')
+    return frame
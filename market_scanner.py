@@ -0,0 +1,117 @@
+"""Cross-book arbitrage and middle scanner.
+
+Works from the best available price on each side of every market, so one
+scan is linear in the number of quotes. An arbitrage is a market whose best
+two-sided implied probability sums below 1; a middle is a spread or total
+where the best lines on the two sides leave a window in which both bets win.
+Quotes with malformed prices are skipped, and arbitrages paying more than
+``MAX_ARBITRAGE_PROFIT`` are dropped as stale or mis-keyed quotes.
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from best_lines import SIDES, BestLines, side_decimal
+from odds_store import NO_PRICE
+
+# (market, side A, side B, line column or None); spreads/totals use the store's convention
+MARKETS = (
+    ('moneyline', 'ml_home', 'ml_away', None),
+    ('spread', 'spread_home', 'spread_away', 'spread'),
+    ('total', 'total_over', 'total_under', 'total'),
+)
+
+# Real cross-book arbitrages pay a few percent at most; anything larger is a bad quote
+MAX_ARBITRAGE_PROFIT = 0.05
+
+
+def _valid_prices(prices: np.ndarray, line_column) -> np.ndarray:
+    """False for malformed American prices (|price| < 100); unpriced spread/total quotes count as valid"""
+    prices = np.asarray(prices, dtype=np.int64)
+    valid = np.abs(prices) >= 100
+    if line_column is not None:
+        valid |= prices == NO_PRICE
+    return valid
+
+
+def _side_arrays(best_lines: BestLines, side: str, line_column):
+    """Best row, decimal price and line per game for one side (NaN where none)"""
+    store = best_lines.store
+    rows = best_lines.best[side][:store.n_games]
+    found = rows >= 0
+    safe = np.where(found, rows, 0)
+    price_column = SIDES[side][1]
+    prices = store.column(price_column)[safe] if len(store) else np.zeros(len(rows), dtype=np.int16)
+    decimal = side_decimal(side, prices)
+    if line_column is not None:
+        lines = store.column(line_column)[safe].astype(float) if len(store) else np.full(len(rows), np.nan)
+    else:
+        lines = np.full(len(rows), np.nan)
+    decimal = np.where(found, decimal, np.nan)
+    return rows, prices, decimal, np.where(found, lines, np.nan)
+
+
+def rank_opportunities(opportunities: Sequence[Dict]) -> List[Dict]:
+    """Arbitrages by guaranteed profit, then middles by window width"""
+    arbitrages = [o for o in opportunities if o['type'] == 'arbitrage']
+    middles = [o for o in opportunities if o['type'] != 'arbitrage']
+    arbitrages.sort(key=lambda o: o['profit_pct'], reverse=True)
+    middles.sort(key=lambda o: (o['middle_width'], o['profit_pct']), reverse=True)
+    return arbitrages + middles
+
+
+def scan_opportunities(best_lines: BestLines, games: Optional[Sequence[int]] = None) -> List[Dict]:
+    """Ranked arbitrages and middles, optionally only for the given game indices"""
+    store = best_lines.store
+    books = store.books.names
+    found = []
+
+    for market, side_a, side_b, line_column in MARKETS:
+        rows_a, prices_a, dec_a, lines_a = _side_arrays(best_lines, side_a, line_column)
+        rows_b, prices_b, dec_b, lines_b = _side_arrays(best_lines, side_b, line_column)
+        valid = ((rows_a >= 0) & (rows_b >= 0) & _valid_prices(prices_a, line_column)
+                 & _valid_prices(prices_b, line_column))
+        with np.errstate(invalid='ignore'):
+            implied = 1 / dec_a + 1 / dec_b
+
+            if line_column is None:
+                window = np.zeros_like(implied)
+                same_line = np.ones(len(implied), dtype=bool)
+            else:
+                # Side A (home/over) wins above its line, side B (away/under) below its own
+                window = lines_b - lines_a
+                same_line = window == 0
+
+            plausible = implied >= 1 / (1 + MAX_ARBITRAGE_PROFIT)
+            is_arb = valid & (implied < 1) & plausible & (same_line | (window > 0))
+            is_middle = valid & (window > 0) & ((implied >= 1) | plausible)
+
+        candidates = is_arb | is_middle
+        if games is not None:
+            candidates &= np.isin(np.arange(len(candidates)), games)
+
+        for game in np.flatnonzero(candidates):
+            total_inverse = implied[game]
+            legs = []
+            for side, rows, prices, dec, lines in ((side_a, rows_a, prices_a, dec_a, lines_a),
+                                                   (side_b, rows_b, prices_b, dec_b, lines_b)):
+                legs.append({
+                    'side': side,
+                    'book': books[store.column('book')[rows[game]]],
+                    'line': None if line_column is None else round(float(lines[game]), 2),
+                    'price': int(prices[game]) if prices[game] != NO_PRICE else None,
+                    'stake_pct': float(100 * (1 / dec[game]) / total_inverse),
+                })
+            opportunity = {
+                'game': store.game_keys[game],
+                'market': market,
+                'type': 'arbitrage' if is_arb[game] else 'middle',
+                'implied_probability': float(total_inverse),
+                'profit_pct': float(100 * (1 / total_inverse - 1)),
+                'middle_width': float(window[game]) if is_middle[game] else 0.0,
+                'legs': legs,
+            }
+            found.append(opportunity)
+
+    return rank_opportunities(found)
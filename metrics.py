@@ -0,0 +1,266 @@
+"""In-process metrics for the refresh pipeline, exported in Prometheus text format.
+
+Counters, gauges and latency histograms live in one thread-safe registry that
+the fetchers, generators, predictor and display functions update as they run.
+``REGISTRY.render()`` produces the Prometheus exposition text; with
+``QWERK_METRICS_PORT`` set, :func:`start_metrics_server` serves it on
+``/metrics`` from a daemon thread. The same numbers feed the in-app
+diagnostics panel through ``REGISTRY.summary()``.
+"""
+
+import bisect
+import logging
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+METRICS_PORT = os.environ.get('QWERK_METRICS_PORT')
+
+# Seconds; spans a cached render up to a source hitting its timeout
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 15.0)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    kind = ''
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    """Monotonic count per label set"""
+    kind = 'counter'
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help_text, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def values(self) -> Dict[Tuple[str, ...], float]:
+        with self._lock:
+            return dict(self._values)
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        for key, value in sorted(self.values().items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Gauge(Counter):
+    """Current value per label set"""
+    kind = 'gauge'
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+
+class Histogram(_Metric):
+    """Bucketed observations (cumulative on export) with sum and count per label set"""
+    kind = 'histogram'
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._counts: Dict[Tuple[str, ...], List[int]] = {}
+        self._sums: Dict[Tuple[str, ...], float] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+                self._sums[key] = 0.0
+            counts[index] += 1
+            self._sums[key] += value
+
+    def series(self) -> Dict[Tuple[str, ...], Tuple[List[int], float]]:
+        """Label set -> (per-bucket counts with a final +Inf bucket, sum)"""
+        with self._lock:
+            return {key: (list(counts), self._sums[key]) for key, counts in self._counts.items()}
+
+    def quantile(self, q: float, counts: Sequence[int]) -> float:
+        """Estimate of the q-quantile from bucket counts, interpolating inside the bucket"""
+        total = sum(counts)
+        if not total:
+            return float('nan')
+        rank = q * total
+        seen = 0
+        for index, count in enumerate(counts):
+            if count and seen + count >= rank:
+                lower = self.buckets[index - 1] if index else 0.0
+                if index == len(self.buckets):
+                    return lower  # beyond the last bound: report the bound
+                return lower + (self.buckets[index] - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-1]
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        for key, (counts, total) in sorted(self.series().items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named metrics of one process"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing  # module reloads (Streamlit reruns) keep the first instance
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help_text, labelnames))
+
+    def gauge(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, help_text, labelnames))
+
+    def histogram(self, name: str, help_text: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help_text, labelnames, buckets))
+
+    def render(self) -> str:
+        """Every metric in Prometheus text exposition format"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+    def summary(self) -> Iterator[Dict]:
+        """One row per histogram series: count, mean, p50 and p95 latency (ms), plus matching error counts"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            if not isinstance(metric, Histogram):
+                continue
+            for key, (counts, total) in sorted(metric.series().items()):
+                count = sum(counts)
+                yield {
+                    'metric': metric.name,
+                    **dict(zip(metric.labelnames, key)),
+                    'count': count,
+                    'mean_ms': 1000 * total / count if count else float('nan'),
+                    'p50_ms': 1000 * metric.quantile(0.5, counts),
+                    'p95_ms': 1000 * metric.quantile(0.95, counts),
+                }
+
+
+REGISTRY = MetricsRegistry()
+
+SOURCE_SECONDS = REGISTRY.histogram('qwerk_source_seconds', 'Latency of each live odds source', ('source',))
+SOURCE_RESULTS = REGISTRY.counter('qwerk_source_results_total', 'Fetch outcomes per odds source',
+                                  ('source', 'outcome'))
+STAGE_SECONDS = REGISTRY.histogram('qwerk_stage_seconds', 'Latency of refresh pipeline stages', ('stage',))
+RENDER_SECONDS = REGISTRY.histogram('qwerk_render_seconds', 'Streamlit render time per panel', ('panel',))
+ERRORS = REGISTRY.counter('qwerk_errors_total', 'Exceptions caught by the pipeline', ('where', 'error'))
+SNAPSHOT_GAMES = REGISTRY.gauge('qwerk_snapshot_games', 'Games in the latest snapshot, and how many were recomputed',
+                                ('kind',))
+
+
+def record_error(where: str, error: BaseException):
+    """Count a handled exception instead of silently dropping it"""
+    ERRORS.inc(where=where, error=type(error).__name__)
+    logger.debug("%s failed: %s", where, error, exc_info=error)
+
+
+@contextmanager
+def timed(histogram: Histogram, **labels):
+    """Observe the block's wall time; exceptions are counted against its first label and re-raised.
+
+    Works as a decorator too (a fresh timer per call, so it is thread-safe).
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    except Exception as e:
+        ERRORS.inc(where=next(iter(labels.values()), histogram.name), error=type(e).__name__)
+        raise
+    finally:
+        histogram.observe(time.perf_counter() - started, **labels)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry = REGISTRY
+
+    def do_GET(self):
+        if self.path.split('?')[0] not in ('/metrics', '/'):
+            self.send_error(404)
+            return
+        body = self.registry.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug("metrics: " + format, *args)
+
+
+def start_metrics_server(port: Optional[int] = None, host: str = '0.0.0.0') -> Optional[ThreadingHTTPServer]:
+    """Serve /metrics from a daemon thread; None when no port is configured"""
+    port = port if port is not None else (int(METRICS_PORT) if METRICS_PORT else None)
+    if port is None:
+        return None
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    logger.info("Serving Prometheus metrics on %s:%d/metrics", host, server.server_address[1])
+    return server
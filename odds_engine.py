@@ -0,0 +1,130 @@
+"""Vectorized odds engine: a whole slate of games x sportsbooks in one pass.
+
+Produces the same markets as the original per-game generator (half-point
+spreads and totals, per-book adjustments, vig jitter and moneylines priced
+from the market spread) as ``(games, books)`` NumPy arrays, so a full season or thousands
+of synthetic markets cost milliseconds instead of a Python loop per cell.
+"""
+
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from odds_math import american_to_implied, spread_to_moneyline
+
+HOME_FIELD_ADVANTAGE = 2.5
+
+# Scoring model, shared with the game simulator so its lines and the books' agree
+POWER_TO_POINTS = 1 / 3.2  # points of expected margin per power-rating point
+BASE_TOTAL = 35.0  # expected total when both offenses rate TOTAL_PIVOT_RATING
+TOTAL_PIVOT_RATING = 75.0
+TOTAL_PER_RATING = 0.3  # points of total per point of average offensive rating
+
+# (book, spread adjustment choices, total adjustment choices, base vig)
+BOOK_PROFILES: Tuple[Tuple[str, Tuple[float, ...], Tuple[float, ...], int], ...] = (
+    ('DraftKings', (0.0,), (0.0,), -110),
+    ('FanDuel', (-0.5, 0.0, 0.5), (-0.5, 0.0, 0.5), -110),
+    ('BetMGM', (-0.5, 0.0, 0.5), (-1.0, -0.5, 0.0, 0.5, 1.0), -105),
+    ('Caesars', (-0.5, 0.0, 0.5), (-0.5, 0.0, 0.5), -110),
+    ('PointsBet', (-1.0, -0.5, 0.0, 0.5, 1.0), (-1.0, -0.5, 0.0, 0.5, 1.0), -105),
+)
+BOOK_NAMES = tuple(profile[0] for profile in BOOK_PROFILES)
+
+
+def half_point(values: np.ndarray) -> np.ndarray:
+    """Round to the nearest half point (.0 or .5), same ties-to-even rule as round()"""
+    return np.round(np.asarray(values, dtype=float) * 2) / 2
+
+
+def _choose(rng: np.random.Generator, choices: Sequence[Sequence[float]], n_rows: int) -> np.ndarray:
+    """Pick one value per (row, column) where each column has its own choice set"""
+    width = max(len(c) for c in choices)
+    table = np.array([list(c) + [0.0] * (width - len(c)) for c in choices])
+    counts = np.array([len(c) for c in choices])
+    idx = (rng.random((n_rows, len(choices))) * counts).astype(int)
+    return table[np.arange(len(choices)), idx]
+
+
+def price_books(spread: np.ndarray, total: np.ndarray,
+                rng: Optional[np.random.Generator] = None,
+                book_profiles=BOOK_PROFILES) -> Dict[str, np.ndarray]:
+    """Apply each book's adjustments, vig and moneylines to per-game market lines.
+
+    ``spread`` and ``total`` have length ``G``; every returned array is
+    ``(G, B)``. Spreads follow the existing convention: positive means the
+    home team is favored.
+    """
+    rng = rng or np.random.default_rng()
+    spread = np.asarray(spread, dtype=float)
+    total = np.asarray(total, dtype=float)
+    n_games = spread.shape[0]
+    n_books = len(book_profiles)
+
+    book_spread = spread[:, None] + _choose(rng, [p[1] for p in book_profiles], n_games)
+    book_total = total[:, None] + _choose(rng, [p[2] for p in book_profiles], n_games)
+
+    vig = np.array([p[3] for p in book_profiles])
+    spread_vig = vig + rng.integers(-5, 6, size=(n_games, n_books))
+    total_vig = vig + rng.integers(-5, 6, size=(n_games, n_books))
+
+    # Moneylines price the shared market line, not the book's shaded spread: the shading is
+    # wider than a book's hold, so per-book lines would cross into cross-book arbitrage.
+    # Each side's handicap is the other side of the home margin; the book's base vig sets its hold
+    hold = 2 * american_to_implied(vig) - 1
+    moneyline_home = spread_to_moneyline(-spread[:, None], hold)
+    moneyline_away = spread_to_moneyline(spread[:, None], hold)
+
+    return {
+        'spread': book_spread,
+        'total': book_total,
+        'spread_vig': spread_vig,
+        'total_vig': total_vig,
+        'moneyline_home': moneyline_home,
+        'moneyline_away': moneyline_away,
+    }
+
+
+def expected_margin(away_power: np.ndarray, home_power: np.ndarray) -> np.ndarray:
+    """Expected home margin from power ratings, home field included"""
+    return ((np.asarray(home_power, dtype=float) + HOME_FIELD_ADVANTAGE) - np.asarray(away_power, dtype=float)) \
+        * POWER_TO_POINTS
+
+
+def expected_total(away_off: np.ndarray, home_off: np.ndarray) -> np.ndarray:
+    """Expected game total from the two offensive ratings"""
+    avg_offensive = (np.asarray(away_off, dtype=float) + np.asarray(home_off, dtype=float)) / 2
+    return BASE_TOTAL + (avg_offensive - TOTAL_PIVOT_RATING) * TOTAL_PER_RATING
+
+
+def generate_slate(away_power: np.ndarray, home_power: np.ndarray,
+                   away_off: np.ndarray, home_off: np.ndarray,
+                   time_factor: float = 0.0,
+                   rng: Optional[np.random.Generator] = None,
+                   book_profiles=BOOK_PROFILES) -> Dict[str, np.ndarray]:
+    """Price every game in the slate at every book.
+
+    Inputs are per-game team ratings (length ``G``). Returns per-game arrays
+    (``base_spread``, ``market_movement``, ``base_total``) plus the ``(G, B)``
+    book arrays from :func:`price_books`.
+    """
+    rng = rng or np.random.default_rng()
+    away_power = np.asarray(away_power, dtype=float)
+    home_power = np.asarray(home_power, dtype=float)
+    n_games = away_power.shape[0]
+
+    # Power rating difference (with home field) -> spread, rounded to the half point
+    base_spread = half_point(expected_margin(away_power, home_power))
+
+    # Time-of-day market movement
+    market_movement = rng.choice([-0.5, 0.0, 0.5], size=n_games) * time_factor
+
+    # Total from average offensive rating plus noise, rounded to the half point
+    base_total = half_point(expected_total(away_off, home_off) + rng.uniform(-2, 2, size=n_games))
+
+    slate = price_books(base_spread + market_movement, base_total, rng, book_profiles)
+    slate.update({
+        'base_spread': base_spread,
+        'market_movement': market_movement,
+        'base_total': base_total,
+    })
+    return slate
@@ -0,0 +1,155 @@
+"""Concurrent multi-source odds fetching for the QWERK Engine.
+
+Every live source is queried at the same time under one overall deadline, so a
+refresh costs roughly as much as the fastest healthy provider instead of the
+sum of all of them.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from team_data import TEAMS
+
+# Default per-source deadlines (seconds); also passed to the source as its HTTP timeout
+SOURCE_TIMEOUTS = {
+    'odds_api': 10.0,
+    'espn_api': 10.0,
+    'sportsdata_api': 10.0,
+    'api_sports': 10.0,
+    'web_scraping': 15.0,
+}
+
+# Merge precedence, most trusted first
+SOURCE_PRIORITY = tuple(SOURCE_TIMEOUTS)
+
+# Shared pool: a straggler keeps running in the background without holding up the refresh
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="odds-fetch")
+
+
+class FetchResult:
+    """Merged odds plus per-source status for one orchestrated fetch"""
+
+    def __init__(self, odds: Dict, succeeded: List[str], empty: List[str],
+                 failed: Dict[str, str], timed_out: List[str], elapsed: float):
+        self.odds = odds
+        self.succeeded = succeeded
+        self.empty = empty
+        self.failed = failed
+        self.timed_out = timed_out
+        self.elapsed = elapsed
+
+    def __repr__(self) -> str:
+        return (f"FetchResult(games={len(self.odds)}, succeeded={self.succeeded}, "
+                f"timed_out={self.timed_out}, elapsed={self.elapsed:.2f}s)")
+
+
+def game_merge_key(game: Dict) -> str:
+    """Source-independent key for a matchup ("Dallas Cowboys", "Cowboys" and "DAL" agree)"""
+    return f"{TEAMS.team_key(game.get('away_team', ''))}@{TEAMS.team_key(game.get('home_team', ''))}"
+
+
+def merge_odds(results: List[Tuple[str, Dict]], priority: Sequence[str] = SOURCE_PRIORITY) -> Dict:
+    """Merge per-source odds by game in ``priority`` order, whatever order the sources finished in.
+
+    Higher-priority sources win on conflicting books. Games flagged ``simulated``
+    (made-up quotes for a matchup a source found without prices) never share a
+    record with live quotes: any live source replaces them, and they only fill
+    matchups no live source quoted.
+    """
+    rank = {name: i for i, name in enumerate(priority)}
+    merged = {}
+    keys = {}
+    for source_name, odds_data in sorted(results, key=lambda result: rank.get(result[0], len(rank))):
+        for game_key, game in odds_data.items():
+            merge_key = game_merge_key(game)
+            simulated = bool(game.get('simulated'))
+            if merge_key in keys and merged[keys[merge_key]].get('simulated') and not simulated:
+                del merged[keys.pop(merge_key)]
+            if merge_key not in keys:
+                record = dict(game)
+                record['sportsbooks'] = dict(game.get('sportsbooks', {}))
+                record['sources'] = [source_name]
+                keys[merge_key] = game_key
+                merged[game_key] = record
+                continue
+
+            record = merged[keys[merge_key]]
+            if simulated and not record.get('simulated'):
+                continue
+            for book, odds in game.get('sportsbooks', {}).items():
+                record['sportsbooks'].setdefault(book, odds)
+            if source_name not in record['sources']:
+                record['sources'].append(source_name)
+    return merged
+
+
+def fetch_all_sources(sources: Dict[str, Callable[[float], Dict]],
+                      deadline: float = 12.0,
+                      timeouts: Optional[Dict[str, float]] = None,
+                      grace: float = 0.25) -> FetchResult:
+    """Run every source concurrently and return as soon as the first good one answers.
+
+    ``sources`` is in priority order: results are merged in that order, not in
+    the order the sources finished. Each source is called with its own timeout (seconds) and must return a dict
+    of games keyed by game key. Once a source returns games, the others get
+    ``grace`` more seconds to land before the merged result is returned; nothing
+    is ever waited on past ``deadline`` or past a source's own timeout.
+    """
+    timeouts = timeouts or SOURCE_TIMEOUTS
+    start = time.monotonic()
+    end = start + deadline
+
+    futures = {}
+    source_deadlines = {}
+    for name, fetch in sources.items():
+        timeout = min(timeouts.get(name, deadline), deadline)
+        futures[_executor.submit(fetch, timeout)] = name
+        source_deadlines[name] = start + timeout
+
+    pending = set(futures)
+    results = []
+    empty = []
+    failed = {}
+    timed_out = []
+
+    while pending:
+        now = time.monotonic()
+        # Stop waiting on any source whose own deadline has passed
+        for future in [f for f in pending if source_deadlines[futures[f]] <= now]:
+            pending.discard(future)
+            future.cancel()
+            timed_out.append(futures[future])
+        if not pending or now >= end:
+            break
+
+        next_deadline = min([end] + [source_deadlines[futures[f]] for f in pending])
+        done, pending = wait(pending, timeout=max(0.0, next_deadline - now),
+                             return_when=FIRST_COMPLETED)
+
+        for future in done:
+            name = futures[future]
+            try:
+                odds_data = future.result()
+            except Exception as e:
+                failed[name] = f"{type(e).__name__}: {e}"
+                continue
+            if odds_data:
+                if not results:
+                    end = min(end, time.monotonic() + grace)
+                results.append((name, odds_data))
+            else:
+                empty.append(name)
+
+    for future in pending:
+        future.cancel()
+        timed_out.append(futures[future])
+
+    return FetchResult(
+        odds=merge_odds(results, priority=list(sources)),
+        succeeded=[name for name, _ in results],
+        empty=empty,
+        failed=failed,
+        timed_out=timed_out,
+        elapsed=time.monotonic() - start,
+    )
@@ -0,0 +1,88 @@
+"""Vectorized odds math: American, decimal and implied probability, and no-vig prices.
+
+Every function takes and returns NumPy arrays of any shape, so a whole slate
+of quotes converts in one call. Missing prices (``NO_PRICE`` or NaN) come out
+as NaN. Spreads map to moneylines through a normal model of the final margin
+centred on the spread, so the same spread always gives the same price.
+"""
+
+import numpy as np
+
+from odds_store import MAX_PRICE, NO_PRICE
+
+MARGIN_SD = 13.5  # SD of an NFL game's final margin around the spread
+STANDARD_PRICE = -110  # assumed for spread/total quotes without a price
+
+# Implied probabilities of the longest and shortest storable prices (+/-MAX_PRICE)
+MIN_IMPLIED = 100 / (MAX_PRICE + 100)
+MAX_IMPLIED = MAX_PRICE / (MAX_PRICE + 100)
+
+
+def _prices(prices: np.ndarray) -> np.ndarray:
+    prices = np.asarray(prices, dtype=float)
+    return np.where((prices == NO_PRICE) | (np.abs(prices) < 100), np.nan, prices)
+
+
+def american_to_decimal(prices: np.ndarray) -> np.ndarray:
+    """American -> decimal odds; NaN where the price is missing"""
+    prices = _prices(prices)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(prices > 0, 1 + prices / 100, 1 + 100 / np.abs(prices))
+
+
+def american_to_implied(prices: np.ndarray) -> np.ndarray:
+    """Implied win probability of an American price, vig included"""
+    return 1 / american_to_decimal(prices)
+
+
+def implied_to_american(probability: np.ndarray) -> np.ndarray:
+    """American odds (unrounded) that pay exactly even money on a win probability"""
+    p = np.clip(np.asarray(probability, dtype=float), 1e-6, 1 - 1e-6)
+    return np.where(p >= 0.5, -100 * p / (1 - p), 100 * (1 - p) / p)
+
+
+STANDARD_DECIMAL = float(american_to_decimal(STANDARD_PRICE))
+STANDARD_HOLD = 2 / STANDARD_DECIMAL - 1  # overround of a -110/-110 market
+
+
+def overround(implied: np.ndarray, axis: int = -1) -> np.ndarray:
+    """Book hold: how far the implied probabilities of all outcomes sum above 1"""
+    return np.sum(implied, axis=axis) - 1
+
+
+def remove_vig(implied: np.ndarray, axis: int = -1) -> np.ndarray:
+    """Fair probabilities: each market's implied probabilities scaled to sum to 1"""
+    implied = np.asarray(implied, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return implied / np.sum(implied, axis=axis, keepdims=True)
+
+
+def no_vig_probabilities(price_a: np.ndarray, price_b: np.ndarray):
+    """Fair (side A, side B) probabilities of two-way markets from their American prices"""
+    fair = remove_vig(np.stack([american_to_implied(price_a), american_to_implied(price_b)], axis=-1))
+    return fair[..., 0], fair[..., 1]
+
+
+def _normal_cdf(x: np.ndarray) -> np.ndarray:
+    """Standard normal CDF (Abramowitz & Stegun 7.1.26, error < 1.5e-7)"""
+    z = np.abs(x) / np.sqrt(2)
+    t = 1 / (1 + 0.3275911 * z)
+    poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429))))
+    erf = 1 - poly * np.exp(-z * z)
+    return 0.5 * (1 + np.sign(x) * erf)
+
+
+def handicap_win_probability(handicap: np.ndarray, sd: float = MARGIN_SD) -> np.ndarray:
+    """Probability that a side laying ``handicap`` points (-7 = favored by 7) wins outright"""
+    return _normal_cdf(-np.asarray(handicap, dtype=float) / sd)
+
+
+def spread_to_moneyline(handicap: np.ndarray, hold: np.ndarray = 0.0, sd: float = MARGIN_SD) -> np.ndarray:
+    """Whole-dollar American moneyline for a side's point handicap (positive = underdog).
+
+    ``hold`` is the book's overround, shared proportionally by both sides; 0
+    gives the fair no-vig price. Prices stay within +/-MAX_PRICE.
+    """
+    implied = np.clip(handicap_win_probability(handicap, sd) * (1 + np.asarray(hold, dtype=float)),
+                      MIN_IMPLIED, MAX_IMPLIED)
+    return np.rint(implied_to_american(implied)).astype(np.int64)
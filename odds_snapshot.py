@@ -0,0 +1,97 @@
+"""Process-wide odds snapshot shared read-only by every Streamlit session.
+
+Odds and predictions are built once per refresh by a background worker and
+published as an immutable snapshot; sessions only remember which version they
+rendered and never wait on a fetch.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class OddsSnapshot:
+    """One published refresh: odds, predictions and when they were built"""
+
+    __slots__ = ('version', 'odds', 'predictions', 'store', 'best_lines', 'opportunities',
+                 'portfolio', 'digests', 'game_metrics', 'dirty_games', 'created_at')
+
+    def __init__(self, version: int, odds: Dict, predictions: Dict,
+                 store=None, best_lines=None, opportunities=(), portfolio=(), digests=None,
+                 game_metrics=None, dirty_games=()):
+        self.version = version
+        self.odds: Mapping = MappingProxyType(odds)
+        self.predictions: Mapping = MappingProxyType(predictions)
+        self.store = store  # OddsStore with the numeric quotes behind ``odds``
+        self.best_lines = best_lines  # BestLines over ``store``
+        self.opportunities = tuple(opportunities)  # ranked arbitrages and middles
+        self.portfolio = tuple(portfolio)  # slate-wide Kelly stakes, largest first
+        self.digests: Mapping = MappingProxyType(digests or {})  # game key -> quote content hash
+        self.game_metrics: Mapping = MappingProxyType(game_metrics or {})  # game key -> derived metrics
+        self.dirty_games = frozenset(dirty_games)  # games recomputed for this snapshot
+        self.created_at = datetime.now()
+
+    def __repr__(self) -> str:
+        return f"OddsSnapshot(version={self.version}, games={len(self.odds)}, created_at={self.created_at:%H:%M:%S})"
+
+
+class SnapshotStore:
+    """Holds the latest snapshot and wakes readers when a newer one is published"""
+
+    def __init__(self):
+        self._latest: Optional[OddsSnapshot] = None
+        self._version = 0
+        self._updated = threading.Condition()
+
+    def latest(self) -> Optional[OddsSnapshot]:
+        return self._latest
+
+    def publish(self, odds: Dict, predictions: Dict, **parts) -> OddsSnapshot:
+        """Publish freshly built data as the new current snapshot"""
+        with self._updated:
+            self._version += 1
+            snapshot = OddsSnapshot(self._version, odds, predictions, **parts)
+            self._latest = snapshot
+            self._updated.notify_all()
+        return snapshot
+
+    def wait_for_update(self, after_version: Optional[int], timeout: float) -> Optional[OddsSnapshot]:
+        """Block until a snapshot newer than ``after_version`` exists or ``timeout`` passes"""
+        with self._updated:
+            self._updated.wait_for(
+                lambda: self._latest is not None and self._latest.version != after_version,
+                timeout=timeout,
+            )
+            return self._latest
+
+
+class RefreshWorker(threading.Thread):
+    """Long-lived daemon thread that builds and publishes snapshots on its own schedule"""
+
+    def __init__(self, store: SnapshotStore, build: Callable[[Optional[OddsSnapshot]], Dict], interval: float):
+        super().__init__(name="odds-refresh", daemon=True)
+        self.store = store
+        self.build = build
+        self.interval = interval
+        self.last_error: Optional[BaseException] = None
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.is_set():
+            started = time.monotonic()
+            try:
+                self.store.publish(**self.build(self.store.latest()))
+                self.last_error = None
+            except Exception as e:
+                # Keep serving the previous snapshot and try again next cycle
+                self.last_error = e
+                logger.exception("Snapshot refresh failed")
+            self._stop_event.wait(max(0.0, self.interval - (time.monotonic() - started)))
+
+    def stop(self):
+        self._stop_event.set()
@@ -0,0 +1,291 @@
+"""Typed columnar store for sportsbook quotes.
+
+One row per (game, book) with numeric line, price and timestamp columns in
+compact NumPy arrays; team and book names are interned to small integer ids.
+Display strings such as "+3.5 (-110)" are produced only at render time.
+"""
+
+import re
+import threading
+import time
+import zlib
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# American odds are never 0, so 0 marks a missing price
+NO_PRICE = 0
+
+# Prices are stored clamped to +/-MAX_PRICE (a 99% favourite or longshot), well inside int16
+MAX_PRICE = 10000
+
+_LINE_RE = re.compile(r'^\s*([+-]?\d+(?:\.\d+)?|PK|PICK)\s*(?:\(\s*([+-]?\d+|EVEN)\s*\))?\s*$', re.IGNORECASE)
+
+# column -> dtype; line columns use NaN for missing, price columns NO_PRICE
+COLUMNS = {
+    'game': np.int32,
+    'book': np.int16,
+    'spread': np.float32,
+    'spread_price_home': np.int16,
+    'spread_price_away': np.int16,
+    'total': np.float32,
+    'over_price': np.int16,
+    'under_price': np.int16,
+    'moneyline_home': np.int16,
+    'moneyline_away': np.int16,
+    'updated_at': np.float64,
+}
+LINE_COLUMNS = ('spread', 'total')
+PRICE_COLUMNS = ('spread_price_home', 'spread_price_away', 'over_price', 'under_price',
+                 'moneyline_home', 'moneyline_away')
+QUOTE_COLUMNS = LINE_COLUMNS + PRICE_COLUMNS
+
+# 64-bit FNV-1a parameters for the vectorized content hashes
+_FNV_OFFSET = np.uint64(0xcbf29ce484222325)
+_FNV_PRIME = np.uint64(0x100000001b3)
+
+
+def _fnv_mix(digest: np.ndarray, values: np.ndarray) -> np.ndarray:
+    return (digest ^ values.astype(np.uint64)) * _FNV_PRIME
+
+
+class Interner:
+    """Bidirectional name <-> small integer id mapping"""
+
+    def __init__(self, names: Iterable[str] = ()):
+        self.names: List[str] = []
+        self.ids: Dict[str, int] = {}
+        for name in names:
+            self.intern(name)
+
+    def intern(self, name: str) -> int:
+        ident = self.ids.get(name)
+        if ident is None:
+            ident = len(self.names)
+            self.names.append(name)
+            self.ids[name] = ident
+        return ident
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+def parse_line(value) -> Tuple[float, int]:
+    """Parse a quote such as -3.5, "+3.5", "47.5 (-108)" or "PK (EVEN)" into (line, price)"""
+    if value is None:
+        return float('nan'), NO_PRICE
+    if isinstance(value, (int, float, np.number)):
+        return float(value), NO_PRICE
+    match = _LINE_RE.match(str(value))
+    if not match:
+        return float('nan'), NO_PRICE
+    line, price = match.groups()
+    line = 0.0 if line.upper() in ('PK', 'PICK') else float(line)
+    return line, parse_price(price) if price else NO_PRICE
+
+
+def clamp_price(price: int) -> int:
+    """An American price clamped to +/-MAX_PRICE; NO_PRICE passes through"""
+    return max(-MAX_PRICE, min(MAX_PRICE, price))
+
+
+def parse_price(value) -> int:
+    """Parse an American price ("-110", +145, "EVEN"); NO_PRICE if unusable"""
+    if isinstance(value, str) and value.strip().upper() == 'EVEN':
+        return 100
+    try:
+        return int(round(float(value)))
+    except (TypeError, ValueError):
+        return NO_PRICE
+
+
+class OddsStore:
+    """Columnar (game, book) quote table with interned teams and books"""
+
+    def __init__(self, capacity: int = 256):
+        self.teams = Interner()
+        self.books = Interner()
+        self.game_keys: List[str] = []
+        self._game_teams = np.zeros((16, 2), dtype=np.int32)  # (away, home) team ids
+        self._game_index: Dict[str, int] = {}
+        self._row_index: Dict[Tuple[int, int], int] = {}
+        self._game_rows: List[List[int]] = []
+        self._size = 0
+        self._data = {name: self._empty(name, capacity) for name in COLUMNS}
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _empty(name: str, n: int) -> np.ndarray:
+        dtype = COLUMNS[name]
+        if name in LINE_COLUMNS:
+            return np.full(n, np.nan, dtype=dtype)
+        return np.zeros(n, dtype=dtype)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def n_games(self) -> int:
+        return len(self.game_keys)
+
+    def _grow(self, needed: int):
+        capacity = len(self._data['game'])
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, capacity * 2)
+        for name, column in self._data.items():
+            grown = self._empty(name, new_capacity)
+            grown[:self._size] = column[:self._size]
+            self._data[name] = grown
+
+    def add_game(self, game_key: str, away_team: str, home_team: str) -> int:
+        """Register a game (idempotent) and return its index"""
+        with self._lock:
+            game = self._game_index.get(game_key)
+            if game is None:
+                game = len(self.game_keys)
+                self._game_index[game_key] = game
+                self.game_keys.append(game_key)
+                self._game_rows.append([])
+                if game >= len(self._game_teams):
+                    self._game_teams = np.concatenate([self._game_teams, np.zeros_like(self._game_teams)])
+                self._game_teams[game] = (self.teams.intern(away_team), self.teams.intern(home_team))
+            return game
+
+    @property
+    def game_teams(self) -> np.ndarray:
+        """(games, 2) array of (away, home) team ids"""
+        return self._game_teams[:self.n_games]
+
+    def game_index(self, game_key: str) -> Optional[int]:
+        return self._game_index.get(game_key)
+
+    def row_for(self, game: int, book: str) -> int:
+        """Row for (game, book), appending an empty one if needed"""
+        with self._lock:
+            book_id = self.books.intern(book)
+            row = self._row_index.get((game, book_id))
+            if row is None:
+                row = self._size
+                self._grow(row + 1)
+                self._data['game'][row] = game
+                self._data['book'][row] = book_id
+                self._row_index[(game, book_id)] = row
+                self._game_rows[game].append(row)
+                self._size += 1
+            return row
+
+    def upsert(self, game_key: str, away_team: str, home_team: str, book: str,
+               updated_at: Optional[float] = None, **values) -> int:
+        """Write one book's quote for a game; unspecified columns are left as-is"""
+        with self._lock:
+            row = self.row_for(self.add_game(game_key, away_team, home_team), book)
+            for name, value in values.items():
+                if name not in COLUMNS or name in ('game', 'book', 'updated_at'):
+                    raise KeyError(f"Unknown quote column: {name}")
+                self._data[name][row] = clamp_price(value) if name in PRICE_COLUMNS else value
+            self._data['updated_at'][row] = time.time() if updated_at is None else updated_at
+            return row
+
+    def upsert_quotes(self, game_key: str, away_team: str, home_team: str, quotes: Iterable[Tuple],
+                      updated_at: Optional[float] = None) -> int:
+        """Write typed quote records (named tuples of ``book`` plus quote columns); returns rows written"""
+        updated_at = time.time() if updated_at is None else updated_at
+        written = 0
+        with self._lock:
+            self.add_game(game_key, away_team, home_team)
+            for quote in quotes:
+                values = quote._asdict()
+                self.upsert(game_key, away_team, home_team, values.pop('book'), updated_at=updated_at, **values)
+                written += 1
+        return written
+
+    def column(self, name: str) -> np.ndarray:
+        """Read-only view of a column over the filled rows"""
+        view = self._data[name][:self._size]
+        view.flags.writeable = False
+        return view
+
+    def game_rows(self, game: int) -> np.ndarray:
+        return np.asarray(self._game_rows[game], dtype=np.int64)
+
+    def row_table(self) -> np.ndarray:
+        """(games, books) array of row indices, -1 where a book has no quote"""
+        table = np.full((self.n_games, len(self.books)), -1, dtype=np.int64)
+        table[self.column('game'), self.column('book')] = np.arange(self._size)
+        return table
+
+    def row_digests(self) -> np.ndarray:
+        """Content hash of every (game, book) quote, ignoring its timestamp"""
+        digest = np.full(self._size, _FNV_OFFSET, dtype=np.uint64)
+        for name in QUOTE_COLUMNS:
+            column = self.column(name)
+            bits = column.view(np.uint32) if column.dtype == np.float32 else column.view(np.uint16)
+            digest = _fnv_mix(digest, bits)
+        return digest
+
+    def game_digests(self) -> np.ndarray:
+        """Order-independent content hash of every game's quotes across books"""
+        book_salt = np.array([zlib.crc32(name.encode('utf-8')) for name in self.books.names], dtype=np.uint64)
+        rows = _fnv_mix(self.row_digests(), book_salt[self.column('book')] if self._size else np.zeros(0, dtype=np.uint64))
+        digests = np.zeros(self.n_games, dtype=np.uint64)
+        np.add.at(digests, self.column('game'), rows)
+        return digests
+
+    @classmethod
+    def from_odds(cls, odds_data: Dict) -> 'OddsStore':
+        """Build a store from the games dict produced by the fetchers/simulation.
+
+        Typed quote records under a game's ``quotes`` (from the ESPN parser) load
+        as they are; only the other books' display quotes are parsed.
+        """
+        store = cls(capacity=max(16, len(odds_data) * 5))
+        now = time.time()
+        for game_key, game in odds_data.items():
+            typed = game.get('quotes') or ()
+            if typed:
+                store.upsert_quotes(game_key, game['away_team'], game['home_team'], typed, updated_at=now)
+            typed_books = {quote.book for quote in typed}
+            for book, quote in game.get('sportsbooks', {}).items():
+                if book in typed_books:
+                    continue
+                spread, spread_price = parse_line(quote.get('spread'))
+                total, total_price = parse_line(quote.get('total'))
+                spread_price = parse_price(quote.get('spread_price', spread_price))
+                total_price = parse_price(quote.get('total_price', total_price))
+                store.upsert(
+                    game_key, game['away_team'], game['home_team'], book, updated_at=now,
+                    spread=spread,
+                    spread_price_home=parse_price(quote.get('spread_price_home', spread_price)),
+                    spread_price_away=parse_price(quote.get('spread_price_away', spread_price)),
+                    total=total,
+                    over_price=parse_price(quote.get('over_price', total_price)),
+                    under_price=parse_price(quote.get('under_price', total_price)),
+                    moneyline_home=parse_price(quote.get('moneyline_home')),
+                    moneyline_away=parse_price(quote.get('moneyline_away')),
+                )
+        return store
+
+    def frame(self, rows: Optional[np.ndarray] = None):
+        """Numeric pandas DataFrame of the given rows (all rows by default)"""
+        import pandas as pd
+
+        rows = np.arange(self._size) if rows is None else np.asarray(rows)
+        game = self._data['game'][rows]
+        teams = np.asarray(self.teams.names, dtype=object)
+        frame = pd.DataFrame({
+            'game': np.asarray(self.game_keys, dtype=object)[game] if len(rows) else [],
+            'away_team': teams[self.game_teams[game, 0]] if len(rows) else [],
+            'home_team': teams[self.game_teams[game, 1]] if len(rows) else [],
+            'sportsbook': np.asarray(self.books.names, dtype=object)[self._data['book'][rows]] if len(rows) else [],
+        })
+        for name in COLUMNS:
+            if name in ('game', 'book'):
+                continue
+            values = self._data[name][rows]
+            if name in PRICE_COLUMNS:
+                values = np.where(values == NO_PRICE, np.nan, values)
+            frame[name] = values
+        frame['updated_at'] = pd.to_datetime(frame['updated_at'], unit='s')
+        return frame
+
@@ -0,0 +1,178 @@
+"""Content-addressed cache of per-game AI predictions.
+
+Entries are keyed by a stable digest of (matchup, quote digest, model
+version), so the same inputs map to the same key in every worker and after
+every restart. A bounded in-memory LRU sits in front of an optional on-disk
+tier of small JSON files that any process pointed at the same directory can
+reuse. The disk tier is pruned every few hundred writes: entries not used
+within ``DEFAULT_MAX_AGE`` go first, then the least recently used beyond
+``DEFAULT_MAX_DISK_ENTRIES``.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+DEFAULT_CACHE_DIR = os.environ.get('QWERK_PREDICTION_CACHE_DIR', os.path.expanduser('~/.qwerk/predictions'))
+DEFAULT_MAX_ENTRIES = 4096
+DEFAULT_MAX_DISK_ENTRIES = 16384
+DEFAULT_MAX_AGE = 7 * 24 * 3600  # seconds since an entry was last written or read
+PRUNE_EVERY = 256  # disk writes between prunes
+_STALE_TMP_AGE = 300  # seconds before an orphaned temp file is removed
+
+
+def stable_digest(*parts) -> str:
+    """Hex digest of the parts that is identical across processes (unlike hash())"""
+    payload = json.dumps(parts, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def stable_seed(*parts) -> int:
+    """Process-independent 64-bit integer seed derived from the parts"""
+    return int(stable_digest(*parts)[:16], 16)
+
+
+def prediction_key(away_team: str, home_team: str, quote_digest, model_version: str) -> str:
+    """Cache key for one game's predictions"""
+    return stable_digest('predictions', f"{away_team}@{home_team}", quote_digest, model_version)
+
+
+class PredictionCache:
+    """Thread-safe LRU of predictions with an optional shared disk tier"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, directory: Optional[str] = None,
+                 max_disk_entries: int = DEFAULT_MAX_DISK_ENTRIES, max_age: float = DEFAULT_MAX_AGE):
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        self.max_entries = max_entries
+        self.directory = directory
+        self.max_disk_entries = max_disk_entries
+        self.max_age = max_age
+        self._writes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def _remember(self, key: str, value: Dict):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Cached predictions for the key from memory, then disk; None on a miss"""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+
+        value = self._read(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.disk_hits += 1
+                self._remember(key, value)
+        return value
+
+    def put(self, key: str, value: Dict):
+        """Store predictions in memory and, if configured, on disk"""
+        with self._lock:
+            self._remember(key, value)
+        self._write(key, value)
+
+    def _read(self, key: str) -> Optional[Dict]:
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                value = json.load(f)
+            os.utime(path)  # mark as recently used for pruning
+            return value
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, key: str, value: Dict):
+        if self.directory is None:
+            return
+        path = self._path(key)
+        tmp_path = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temp file and rename so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(value, f, separators=(',', ':'))
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError):
+            # Unwritable directory or a value JSON can't encode: keep it in memory only
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+            return
+
+        with self._lock:
+            self._writes += 1
+            due = self._writes % PRUNE_EVERY == 0
+        if due:
+            self.prune()
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """Delete disk entries unused for ``max_age``, then the oldest beyond ``max_disk_entries``.
+
+        Returns the number of files removed.
+        """
+        if self.directory is None:
+            return 0
+        now = time.time() if now is None else now
+        entries = []
+        removed = 0
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    mtime = os.stat(path).st_mtime
+                    if name.endswith('.tmp'):
+                        if now - mtime > _STALE_TMP_AGE:
+                            os.unlink(path)
+                            removed += 1
+                    elif name.endswith('.json'):
+                        if now - mtime > self.max_age:
+                            os.unlink(path)
+                            removed += 1
+                        else:
+                            entries.append((mtime, path))
+                except OSError:
+                    continue  # removed by another process meanwhile
+
+        entries.sort()
+        for _, path in entries[:max(len(entries) - self.max_disk_entries, 0)]:
+            try:
+                os.unlink(path)
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+    def clear(self):
+        """Drop the in-memory tier (disk entries are left for other processes)"""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,113 @@
+"""Templated AI reasoning bullets, memoized per (matchup, picks, seed).
+
+Templates are split into literal and slot tokens once at import, so a render
+is a handful of choices and one join. Output depends only on the arguments,
+which makes it safe to share through a bounded LRU across games, refreshes
+and sessions.
+"""
+
+import functools
+import random
+import string
+from typing import Dict, Optional, Sequence, Tuple
+
+from team_data import TEAMS
+
+REASONING_CACHE_SIZE = 2048
+
+# (literal text, slot name or None) pairs
+Template = Tuple[Tuple[str, Optional[str]], ...]
+
+DEFAULT_AWAY_FACTORS = ('offensive potential', 'defensive improvements', 'coaching changes', 'young talent')
+DEFAULT_HOME_FACTORS = ('home field advantage', 'defensive strength', 'offensive weapons', 'coaching stability')
+
+# Slots filled by a random choice from a fixed pool
+_POOLS = {
+    'over_offense': ('high-powered offenses', 'explosive playmakers', 'weak defensive secondaries'),
+    'over_conditions': ('dome environment', 'favorable wind patterns', 'warm temperatures'),
+    'over_history': ('exceeded totals', 'featured high-scoring affairs', 'seen defensive struggles'),
+    'under_defense': ('strong pass rush', 'elite secondary play', 'improved run stopping'),
+    'under_conditions': ('cold temperatures', 'potential wind', 'defensive weather'),
+    'under_style': ('ground-and-pound', 'ball control', 'time-consuming drives'),
+    'metric': ('DVOA ratings', 'EPA per play', 'success rate', 'explosive play percentage'),
+    'situation': ('red zone efficiency', 'third down conversions', 'turnover differential', 'time of possession'),
+    'history_spot': ('primetime games', 'divisional matchups', 'similar weather conditions', 'playoff-type atmospheres'),
+    'market_read': ('contrarian opportunity', 'public fade spot', 'sharp consensus play'),
+}
+
+_FORMATTER = string.Formatter()
+
+
+def _tokenize(template: str) -> Template:
+    return tuple((literal, field) for literal, field, _, _ in _FORMATTER.parse(template))
+
+
+def _bullets(header: str, templates: Sequence[str], suffix: str = '') -> Tuple[Template, ...]:
+    return tuple(_tokenize(f"• **{header}**: {template}{suffix}") for template in templates)
+
+
+_SPREAD_HOME = _bullets('Home Field Advantage', [
+    "{home} benefits from {home_factor} and crowd support, giving them the edge against the spread",
+])
+_SPREAD_AWAY = _bullets('Road Warrior Value', [
+    "{away} shows {away_factor} that translates well on the road, making them the spread play",
+])
+_OVER = _bullets('Over Analysis', [
+    "Both teams feature {over_offense}",
+    "Weather conditions and {over_conditions} favor scoring",
+    "Recent matchups between these teams have {over_history}",
+], ", pushing this game over the total")
+_UNDER = _bullets('Under Analysis', [
+    "Both defenses show {under_defense}",
+    "Weather conditions including {under_conditions} limit scoring",
+    "Both teams prefer {under_style} offensive approaches",
+], ", keeping scoring below the total")
+_MATCHUP = _bullets('Key Matchup', [
+    "{away}'s {away_factor} creates favorable matchups against {home}'s defensive scheme",
+    "{home}'s {home_factor} should neutralize {away}'s primary offensive threats",
+    "Key injury reports favor {either_team} with better depth and health status",
+    "Recent form analysis shows {either_team} trending upward in key performance metrics",
+])
+_ANALYTICS = _bullets('Analytics Edge', [
+    "Advanced metrics show {ml_pick} with superior {metric}",
+    "Situational analysis favors {ml_pick} in {situation}",
+    "Historical data indicates {ml_pick} performs better in {history_spot}",
+])
+_MARKET = _bullets('Market Intelligence', [
+    "Sharp money movement suggests {either_team} offers better value than public perception indicates",
+    "Line movement and betting percentages reveal {market_read}",
+    "Historical performance against similar spreads favors {either_team} in this spot",
+])
+
+
+def _render(template: Template, context: Dict[str, str], pools: Dict[str, Sequence[str]],
+            rng: random.Random) -> str:
+    parts = []
+    for literal, field in template:
+        parts.append(literal)
+        if field is not None:
+            parts.append(context[field] if field in context else rng.choice(pools[field]))
+    return ''.join(parts)
+
+
+@functools.lru_cache(maxsize=REASONING_CACHE_SIZE)
+def render_reasoning(away_team: str, home_team: str, spread_pick: str, total_pick: str, ml_pick: str,
+                     seed: int) -> Tuple[str, ...]:
+    """Five reasoning bullets (spread, total, matchup, analytics, market) for the picks"""
+    rng = random.Random(seed)
+    away = TEAMS.get(away_team)
+    home = TEAMS.get(home_team)
+    pools = dict(_POOLS,
+                 away_factor=away.factors if away else DEFAULT_AWAY_FACTORS,
+                 home_factor=home.factors if home else DEFAULT_HOME_FACTORS,
+                 either_team=(away_team, home_team))
+    context = {'away': away_team, 'home': home_team, 'ml_pick': ml_pick}
+
+    sections = (
+        _SPREAD_HOME if spread_pick == home_team else _SPREAD_AWAY,
+        _OVER if total_pick == 'OVER' else _UNDER,
+        _MATCHUP,
+        _ANALYTICS,
+        _MARKET,
+    )
+    return tuple(_render(rng.choice(section), context, pools, rng) for section in sections)
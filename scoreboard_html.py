@@ -0,0 +1,147 @@
+"""Streaming team-matchup extraction from scoreboard HTML.
+
+An event-based tokenizer (``html.parser``) hands each visible text node to an
+Aho–Corasick automaton over every team name and nickname, so the page is
+scanned once for all 32 teams and no DOM is ever built. Mentions keep their
+position on the page, and matchups are paired in page order.
+"""
+
+from collections import deque
+from html.parser import HTMLParser
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from team_data import TEAMS
+
+# Text inside these tags is never shown on the page
+_HIDDEN_TAGS = frozenset(('script', 'style', 'noscript', 'template'))
+
+
+class TeamMatcher:
+    """Aho–Corasick automaton mapping many patterns to values in one pass over the text"""
+
+    def __init__(self, patterns: Dict[str, int]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[int, int]]] = [[]]  # (pattern length, value)
+
+        for pattern, value in patterns.items():
+            state = 0
+            for char in pattern.lower():
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                    self._goto[state][char] = next_state
+                state = next_state
+            self._output[state].append((len(pattern), value))
+
+        # Breadth-first failure links; each state inherits its fallback's outputs
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def find(self, text: str) -> List[Tuple[int, int, int]]:
+        """Whole-word, non-overlapping (start, end, value) matches, longest first on overlap"""
+        lowered = text.lower()
+        candidates = []
+        state = 0
+        for end, char in enumerate(lowered, 1):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for length, value in self._output[state]:
+                start = end - length
+                if _is_boundary(lowered, start - 1) and _is_boundary(lowered, end):
+                    candidates.append((start, end, value))
+
+        # Prefer "Dallas Cowboys" over the "Cowboys" inside it
+        candidates.sort(key=lambda match: (match[0], match[0] - match[1]))
+        matches = []
+        covered = 0
+        for start, end, value in candidates:
+            if start >= covered:
+                matches.append((start, end, value))
+                covered = end
+        return matches
+
+
+def _is_boundary(text: str, index: int) -> bool:
+    return index < 0 or index >= len(text) or not text[index].isalnum()
+
+
+TEAM_MATCHER = TeamMatcher({alias: team_id for team_id in range(len(TEAMS))
+                            for alias in (TEAMS.names[team_id], TEAMS.nicknames[team_id])})
+
+
+class TeamMentionParser(HTMLParser):
+    """Collects (page position, team id) for every team named in visible text"""
+
+    def __init__(self, matcher: TeamMatcher = TEAM_MATCHER):
+        super().__init__(convert_charrefs=True)
+        self.matcher = matcher
+        self.mentions: List[Tuple[int, int]] = []
+        self._position = 0
+        self._hidden_depth = 0
+        self._text: List[str] = []
+
+    def _flush_text(self):
+        # One text node at a time: a name never spans tags, and nothing larger is held
+        if self._text:
+            text = ''.join(self._text)
+            self._text = []
+            for start, _, team_id in self.matcher.find(text):
+                self.mentions.append((self._position + start, team_id))
+            self._position += len(text)
+
+    def handle_starttag(self, tag, attrs):
+        self._flush_text()
+        if tag in _HIDDEN_TAGS:
+            self._hidden_depth += 1
+
+    def handle_endtag(self, tag):
+        self._flush_text()
+        if tag in _HIDDEN_TAGS and self._hidden_depth:
+            self._hidden_depth -= 1
+
+    def handle_data(self, data):
+        if not self._hidden_depth:
+            self._text.append(data)
+
+    def close(self):
+        super().close()
+        self._flush_text()
+
+
+def pair_matchups(mentions: Iterable[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """(away, home) team ids from mentions in page order; each team plays once"""
+    matchups = []
+    paired = set()
+    pending: Optional[int] = None
+    for _, team_id in sorted(mentions):
+        if team_id in paired or team_id == pending:
+            continue
+        if pending is None:
+            pending = team_id
+        else:
+            matchups.append((pending, team_id))
+            paired.update((pending, team_id))
+            pending = None
+    return matchups
+
+
+def extract_matchups(chunks: Iterable[str]) -> List[Tuple[str, str]]:
+    """(away, home) full team names from HTML fed in chunks, in page order"""
+    parser = TeamMentionParser()
+    for chunk in chunks:
+        parser.feed(chunk)
+    parser.close()
+    return [(TEAMS.names[away], TEAMS.names[home]) for away, home in pair_matchups(parser.mentions)]
@@ -0,0 +1,279 @@
+"""Multi-core NFL season and playoff simulator.
+
+Builds a 17-game, 272-game schedule from the registry's divisions using the
+league's rotation formula, then simulates whole seasons in vectorized
+batches. Large runs are spread over a persistent process pool, started on
+first use, with one or two tasks per worker. Small runs stay in-process,
+where they finish before a worker could be dispatched. The schedule and
+per-game expected margins live in one shared-memory block that workers map
+instead of receiving pickled copies; each worker returns only small count
+arrays, which are summed into win-total, division and playoff-seed tables.
+"""
+
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from game_simulator import FORM_WEIGHT
+from odds_engine import expected_margin
+from odds_math import MARGIN_SD
+from team_data import TEAMS
+
+GAMES_PER_TEAM = 17
+PLAYOFF_SEEDS = 7
+RATING_SD = 1.5  # season-long strength uncertainty per team, in points of margin
+SEASONS_PER_BATCH = 2000
+SEASONS_PER_CHUNK = 500  # seeded unit of work; fixed so results don't depend on the worker count
+MIN_SEASONS_PER_WORKER = 5000  # below this a worker's share is cheaper in-process than dispatched
+TASKS_PER_WORKER = 2  # chunks are grouped into this many tasks per worker
+
+CONFERENCES = ('AFC', 'NFC')
+DIVISIONS = ('East', 'North', 'South', 'West')
+
+
+def _division_members() -> Dict[Tuple[str, str], List[int]]:
+    """(conference, division) -> team ids, best power rating first (the 'place' for rotation games)"""
+    members = {(conference, division): [] for conference in CONFERENCES for division in DIVISIONS}
+    for team_id, team in enumerate(TEAMS.teams):
+        members[(team.conference, team.division)].append(team_id)
+    for teams in members.values():
+        teams.sort(key=lambda team_id: -TEAMS.power_rating[team_id])
+    return members
+
+
+def build_schedule() -> np.ndarray:
+    """(272, 2) array of (away, home) team ids; every team plays 17 games"""
+    members = _division_members()
+    games = []
+
+    def division(conference: int, index: int) -> List[int]:
+        return members[(CONFERENCES[conference], DIVISIONS[index % 4])]
+
+    def full_division(a: List[int], b: List[int]):
+        for i, team_a in enumerate(a):
+            for j, team_b in enumerate(b):
+                games.append((team_a, team_b) if (i + j) % 2 else (team_b, team_a))
+
+    def same_place(a: List[int], b: List[int], flip: int):
+        for place, (team_a, team_b) in enumerate(zip(a, b)):
+            games.append((team_a, team_b) if (place + flip) % 2 else (team_b, team_a))
+
+    for conference in range(2):
+        for index in range(4):
+            teams = division(conference, index)
+            # Home and away against each division rival
+            for i, team_a in enumerate(teams):
+                for team_b in teams[i + 1:]:
+                    games.extend([(team_a, team_b), (team_b, team_a)])
+
+        # One full intra-conference division, then same-place teams from the other two
+        for index in (0, 2):
+            full_division(division(conference, index), division(conference, index + 1))
+        for index in (0, 1):
+            for other in (2, 3):
+                same_place(division(conference, index), division(conference, other), index + other)
+
+    # One full inter-conference division, plus a 17th game against the same-place team of another
+    for index in range(4):
+        full_division(division(0, index), division(1, index + 1))
+        same_place(division(0, index), division(1, index + 2), index)
+
+    schedule = np.array(games, dtype=np.int16)
+    assert len(schedule) == len(TEAMS) * GAMES_PER_TEAM // 2
+    return schedule
+
+
+def expected_margins(schedule: np.ndarray) -> np.ndarray:
+    """Expected home margin per scheduled game, on the game simulator's scale"""
+    away, home = schedule[:, 0], schedule[:, 1]
+    return (expected_margin(TEAMS.power_rating[away], TEAMS.power_rating[home])
+            + FORM_WEIGHT * (TEAMS.recent_form[home] - TEAMS.recent_form[away])).astype(np.float64)
+
+
+# Arrays shared with workers: name -> dtype
+_SHARED_DTYPES = {'schedule': np.int16, 'margin': np.float64, 'division': np.int8, 'conference': np.int8}
+
+
+def _share(arrays: Dict[str, np.ndarray]) -> Tuple[shared_memory.SharedMemory, Dict]:
+    """Copy arrays into one shared block; returns it and the picklable layout"""
+    layout = {}
+    offset = 0
+    for name, array in arrays.items():
+        offset = -(-offset // 8) * 8  # keep every array 8-byte aligned
+        layout[name] = (offset, array.shape, array.dtype.str)
+        offset += array.nbytes
+    block = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+    for name, array in arrays.items():
+        _view(block, layout[name])[...] = array
+    return block, layout
+
+
+def _view(block: shared_memory.SharedMemory, spec: Tuple) -> np.ndarray:
+    offset, shape, dtype = spec
+    return np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf, offset=offset)
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    """The shared worker pool, started (or grown) on demand so spawn and import costs are paid once"""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers < workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            # Spawned workers never inherit the app's threads or locks
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+            _pool_workers = workers
+        return _pool
+
+
+def shutdown_pool():
+    """Stop the shared worker pool, if one was started"""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True)
+        _pool, _pool_workers = None, 0
+
+
+atexit.register(shutdown_pool)
+
+
+def simulate_seasons(schedule: np.ndarray, margin: np.ndarray, division: np.ndarray, conference: np.ndarray,
+                     n_seasons: int, rng: np.random.Generator) -> Dict[str, np.ndarray]:
+    """Simulate ``n_seasons`` seasons; returns summed counts per team"""
+    n_teams = len(division)
+    counts = {
+        'wins': np.zeros((n_teams, GAMES_PER_TEAM + 1), dtype=np.int64),
+        'division': np.zeros(n_teams, dtype=np.int64),
+        'seeds': np.zeros((n_teams, PLAYOFF_SEEDS + 1), dtype=np.int64),  # column 0: missed the playoffs
+    }
+    away, home = schedule[:, 0].astype(np.int64), schedule[:, 1].astype(np.int64)
+    team_rows = np.arange(n_teams)
+    games = np.arange(len(schedule))
+    home_games = np.zeros((len(schedule), n_teams), dtype=np.float32)
+    away_games = np.zeros((len(schedule), n_teams), dtype=np.float32)
+    home_games[games, home] = 1
+    away_games[games, away] = 1
+
+    done = 0
+    while done < n_seasons:
+        size = min(SEASONS_PER_BATCH, n_seasons - done)
+        # Season-long strength shocks, then one margin draw per game
+        strength = rng.normal(0.0, RATING_SD, size=(size, n_teams))
+        game_margin = (margin + strength[:, home] - strength[:, away]
+                       + rng.normal(0.0, MARGIN_SD, size=(size, len(schedule))))
+        home_won = (game_margin > 0).astype(np.float32)
+        wins = np.rint(home_won @ home_games + (1 - home_won) @ away_games).astype(np.int64)
+        counts['wins'] += np.stack([np.bincount(wins[:, t], minlength=GAMES_PER_TEAM + 1) for t in team_rows])
+
+        # Ties on wins are broken at random
+        rank_key = wins + rng.random((size, n_teams))
+        division_winner = np.zeros((size, n_teams), dtype=bool)
+        for div in np.unique(division):
+            members = np.flatnonzero(division == div)
+            best = members[np.argmax(rank_key[:, members], axis=1)]
+            division_winner[np.arange(size), best] = True
+        counts['division'] += division_winner.sum(axis=0)
+
+        # Seeds 1-4: division winners by record; 5-7: best remaining records
+        for conf in np.unique(conference):
+            members = np.flatnonzero(conference == conf)
+            key = rank_key[:, members] + 100 * division_winner[:, members]
+            order = np.argsort(-key, axis=1)[:, :PLAYOFF_SEEDS]
+            seeded = members[order]
+            for seed in range(PLAYOFF_SEEDS):
+                counts['seeds'][:, seed + 1] += np.bincount(seeded[:, seed], minlength=n_teams)
+        done += size
+
+    counts['seeds'][:, 0] = n_seasons - counts['seeds'][:, 1:].sum(axis=1)
+    return counts
+
+
+def _simulate_chunks(arrays: Dict[str, np.ndarray], sizes: List[int],
+                     seeds: List[np.random.SeedSequence]) -> Dict[str, np.ndarray]:
+    """Summed counts over consecutive seeded chunks of seasons"""
+    results = [simulate_seasons(arrays['schedule'], arrays['margin'], arrays['division'], arrays['conference'],
+                                size, np.random.default_rng(seed))
+               for size, seed in zip(sizes, seeds)]
+    return {name: sum(result[name] for result in results) for name in results[0]}
+
+
+def _simulate_task(block_name: str, layout: Dict, sizes: List[int],
+                   seeds: List[np.random.SeedSequence]) -> Dict[str, np.ndarray]:
+    """Worker entry point: map the shared arrays and simulate a group of chunks"""
+    block = shared_memory.SharedMemory(name=block_name)
+    try:
+        arrays = {name: _view(block, spec) for name, spec in layout.items()}
+        counts = _simulate_chunks(arrays, sizes, seeds)
+        del arrays  # drop the views before unmapping
+        return counts
+    finally:
+        block.close()
+
+
+def run_season_simulation(n_seasons: int = 20000, workers: Optional[int] = None, seed: Optional[int] = None,
+                          schedule: Optional[np.ndarray] = None):
+    """Simulate seasons, across the shared process pool for large runs, and return one row per team"""
+    schedule = build_schedule() if schedule is None else schedule
+    workers = max(1, min(workers or os.cpu_count() or 1, n_seasons // MIN_SEASONS_PER_WORKER))
+    arrays = {
+        'schedule': schedule.astype(_SHARED_DTYPES['schedule']),
+        'margin': expected_margins(schedule).astype(_SHARED_DTYPES['margin']),
+        'division': TEAMS.division_id.astype(_SHARED_DTYPES['division']),
+        'conference': np.array([CONFERENCES.index(team.conference) for team in TEAMS.teams],
+                               dtype=_SHARED_DTYPES['conference']),
+    }
+
+    chunk_sizes = [min(SEASONS_PER_CHUNK, n_seasons - start) for start in range(0, n_seasons, SEASONS_PER_CHUNK)]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunk_sizes))
+
+    if workers == 1:
+        return season_table(_simulate_chunks(arrays, chunk_sizes, seeds), n_seasons)
+
+    # Consecutive chunks grouped into a few tasks per worker: per-task overhead stays small
+    tasks = np.array_split(np.arange(len(chunk_sizes)), min(len(chunk_sizes), workers * TASKS_PER_WORKER))
+    block, layout = _share(arrays)
+    try:
+        pool = _get_pool(workers)
+        futures = [pool.submit(_simulate_task, block.name, layout, [chunk_sizes[i] for i in task],
+                               [seeds[i] for i in task]) for task in tasks]
+        results = [future.result() for future in futures]
+    except BrokenProcessPool:
+        shutdown_pool()  # start a fresh pool next time
+        raise
+    finally:
+        block.close()
+        block.unlink()
+
+    totals = {name: sum(result[name] for result in results) for name in results[0]}
+    return season_table(totals, n_seasons)
+
+
+def season_table(counts: Dict[str, np.ndarray], n_seasons: int):
+    """Probability table (percent) per team from summed season counts"""
+    import pandas as pd
+
+    wins = counts['wins']
+    table = pd.DataFrame({
+        'team': TEAMS.names,
+        'division': TEAMS.divisions,
+        'mean_wins': wins @ np.arange(GAMES_PER_TEAM + 1) / n_seasons,
+        'wins_10_plus': 100 * wins[:, 10:].sum(axis=1) / n_seasons,
+        'division_pct': 100 * counts['division'] / n_seasons,
+        'playoff_pct': 100 * counts['seeds'][:, 1:].sum(axis=1) / n_seasons,
+    })
+    for seed in range(1, PLAYOFF_SEEDS + 1):
+        table[f'seed_{seed}_pct'] = 100 * counts['seeds'][:, seed] / n_seasons
+    return table.sort_values(['division', 'mean_wins'], ascending=[True, False]).reset_index(drop=True)
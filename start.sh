@@ -3,5 +3,10 @@
 # Set default port if PORT is not set
 PORT=${PORT:-8501}
 
+# Log the cold-start import profile first when asked
+if [ -n "$QWERK_PROFILE_STARTUP" ]; then
+    python benchmarks/startup.py app || true
+fi
+
 # Start Streamlit
 exec streamlit run app.py --server.port=$PORT --server.address=0.0.0.0
@@ -0,0 +1,175 @@
+"""NFL team registry: one immutable table of teams, built once at import.
+
+Every alias (full name, nickname, abbreviation) resolves to a small integer
+team id in O(1), so odds from different sources join on the same id, and
+ratings live in compact NumPy arrays indexed by that id.
+"""
+
+from types import MappingProxyType
+from typing import Iterable, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+
+class Team(NamedTuple):
+    name: str
+    abbreviation: str
+    conference: str
+    division: str
+    power_rating: int
+    off_rating: int
+    def_rating: int
+    recent_form: float
+    factors: Tuple[str, ...]
+
+    @property
+    def nickname(self) -> str:
+        return self.name.split()[-1]
+
+
+# Ratings are based on 2024 performance + offseason moves
+_TEAMS = (
+    Team('Kansas City Chiefs', 'KC', 'AFC', 'West', 95, 92, 88, 0.85,
+         ('elite quarterback play', 'championship experience', 'strong offensive line', 'playoff-tested defense')),
+    Team('Buffalo Bills', 'BUF', 'AFC', 'East', 92, 89, 86, 0.82,
+         ('explosive passing offense', 'improved rushing attack', 'elite pass rush', 'home field advantage')),
+    Team('San Francisco 49ers', 'SF', 'NFC', 'West', 90, 88, 91, 0.78,
+         ('dominant defense', 'versatile offensive scheme', 'strong running game', 'coaching advantage')),
+    Team('Philadelphia Eagles', 'PHI', 'NFC', 'East', 88, 85, 84, 0.80,
+         ('balanced offensive attack', 'aggressive defense', 'strong special teams', 'divisional familiarity')),
+    Team('Dallas Cowboys', 'DAL', 'NFC', 'East', 87, 89, 82, 0.75,
+         ('high-powered offense', 'playmaking defense', 'home crowd support', 'divisional rivalry intensity')),
+    Team('Baltimore Ravens', 'BAL', 'AFC', 'North', 86, 84, 89, 0.83,
+         ('dynamic rushing offense', 'opportunistic defense', 'strong coaching', 'playoff experience')),
+    Team('Cincinnati Bengals', 'CIN', 'AFC', 'North', 85, 91, 78, 0.77,
+         ('elite passing offense', 'improved offensive line', 'young core talent', 'recent success momentum')),
+    Team('Miami Dolphins', 'MIA', 'AFC', 'East', 84, 87, 79, 0.72,
+         ('explosive offensive weapons', 'improved defense', 'speed advantage', 'warm weather home games')),
+    Team('Los Angeles Chargers', 'LAC', 'AFC', 'West', 83, 82, 85, 0.74,
+         ('elite quarterback', 'strong pass rush', 'defensive playmakers', 'coaching stability')),
+    Team('New York Jets', 'NYJ', 'AFC', 'East', 82, 78, 87, 0.71,
+         ('elite defense', 'improved offensive line', 'veteran leadership', 'home field energy')),
+    Team('Pittsburgh Steelers', 'PIT', 'AFC', 'North', 81, 76, 88, 0.76,
+         ('strong defense', 'physical running game', 'coaching experience', 'divisional toughness')),
+    Team('Cleveland Browns', 'CLE', 'AFC', 'North', 80, 79, 83, 0.69,
+         ('strong running game', 'elite pass rush', 'defensive depth', 'home field advantage')),
+    Team('Tennessee Titans', 'TEN', 'AFC', 'South', 79, 77, 81, 0.68,
+         ('physical running game', 'defensive experience', 'home field advantage', 'coaching stability')),
+    Team('Indianapolis Colts', 'IND', 'AFC', 'South', 78, 80, 76, 0.70,
+         ('strong offensive line', 'defensive depth', 'home field advantage', 'coaching experience')),
+    Team('Jacksonville Jaguars', 'JAX', 'AFC', 'South', 77, 81, 73, 0.66,
+         ('offensive playmakers', 'defensive improvements', 'home field energy', 'young core talent')),
+    Team('Houston Texans', 'HOU', 'AFC', 'South', 76, 83, 71, 0.73,
+         ('young quarterback development', 'defensive improvements', 'home crowd support', 'coaching innovation')),
+    Team('Green Bay Packers', 'GB', 'NFC', 'North', 89, 86, 84, 0.79,
+         ('elite quarterback', 'strong receiving corps', 'improved defense', 'cold weather advantage')),
+    Team('Minnesota Vikings', 'MIN', 'NFC', 'North', 85, 84, 82, 0.76,
+         ('strong passing attack', 'defensive playmakers', 'home field advantage', 'divisional knowledge')),
+    Team('Detroit Lions', 'DET', 'NFC', 'North', 84, 88, 78, 0.81,
+         ('explosive offense', 'improved defense', 'home crowd energy', 'coaching innovation')),
+    Team('Chicago Bears', 'CHI', 'NFC', 'North', 78, 75, 83, 0.67,
+         ('strong defense', 'improved offensive line', 'young talent development', 'divisional rivalry')),
+    Team('New Orleans Saints', 'NO', 'NFC', 'South', 82, 81, 84, 0.74,
+         ('strong home field advantage', 'defensive experience', 'coaching stability', 'divisional familiarity')),
+    Team('Atlanta Falcons', 'ATL', 'NFC', 'South', 80, 85, 76, 0.72,
+         ('explosive offensive potential', 'improved defense', 'home dome advantage', 'coaching changes')),
+    Team('Carolina Panthers', 'CAR', 'NFC', 'South', 76, 74, 79, 0.64,
+         ('defensive playmakers', 'young talent', 'divisional familiarity', 'home field support')),
+    Team('Tampa Bay Buccaneers', 'TB', 'NFC', 'South', 83, 87, 77, 0.75,
+         ('offensive firepower', 'veteran leadership', 'warm weather advantage', 'recent success')),
+    Team('Los Angeles Rams', 'LAR', 'NFC', 'West', 86, 84, 85, 0.77,
+         ('offensive line strength', 'defensive experience', 'coaching advantage', 'home field benefit')),
+    Team('Seattle Seahawks', 'SEA', 'NFC', 'West', 84, 82, 81, 0.73,
+         ('strong home field advantage', 'defensive improvements', 'running game strength', 'coaching experience')),
+    Team('Arizona Cardinals', 'ARI', 'NFC', 'West', 79, 83, 75, 0.69,
+         ('offensive weapons', 'improved defense', 'home field advantage', 'coaching stability')),
+    Team('New York Giants', 'NYG', 'NFC', 'East', 77, 73, 82, 0.65,
+         ('defensive improvements', 'offensive line strength', 'home field advantage', 'coaching stability')),
+    Team('Washington Commanders', 'WAS', 'NFC', 'East', 78, 79, 78, 0.68,
+         ('defensive playmakers', 'improved offense', 'home field support', 'divisional knowledge')),
+    Team('New England Patriots', 'NE', 'AFC', 'East', 75, 71, 80, 0.63,
+         ('coaching advantage', 'defensive discipline', 'home field benefit', 'system familiarity')),
+    Team('Las Vegas Raiders', 'LV', 'AFC', 'West', 76, 77, 76, 0.66,
+         ('offensive weapons', 'improved defense', 'home field advantage', 'coaching changes')),
+    Team('Denver Broncos', 'DEN', 'AFC', 'West', 80, 78, 84, 0.71,
+         ('strong defense', 'altitude advantage', 'coaching improvements', 'home field benefit')),
+)
+
+# Abbreviations other feeds use for the same teams
+_EXTRA_ALIASES = {'WSH': 'WAS', 'JAC': 'JAX', 'LA': 'LAR', 'LVR': 'LV', 'KAN': 'KC', 'NWE': 'NE',
+                  'NOR': 'NO', 'TAM': 'TB', 'SFO': 'SF', 'GNB': 'GB'}
+
+# Ratings assumed for a team the registry doesn't know
+DEFAULT_POWER_RATING = 80
+DEFAULT_OFF_RATING = 80
+DEFAULT_DEF_RATING = 80
+DEFAULT_RECENT_FORM = 0.70
+
+
+def _frozen(values, dtype) -> np.ndarray:
+    array = np.array(values, dtype=dtype)
+    array.flags.writeable = False
+    return array
+
+
+class TeamRegistry:
+    """Immutable alias -> team id index plus per-team rating arrays"""
+
+    def __init__(self, teams: Tuple[Team, ...] = _TEAMS):
+        self.teams = teams
+        self.names = tuple(team.name for team in teams)
+        self.nicknames = tuple(team.nickname for team in teams)
+        self.abbreviations = tuple(team.abbreviation for team in teams)
+        self.divisions = tuple(f"{team.conference} {team.division}" for team in teams)
+
+        aliases = {}
+        for team_id, team in enumerate(teams):
+            for alias in (team.name, team.nickname, team.abbreviation):
+                aliases[alias.lower()] = team_id
+        by_abbreviation = {team.abbreviation: team_id for team_id, team in enumerate(teams)}
+        for alias, abbreviation in _EXTRA_ALIASES.items():
+            aliases[alias.lower()] = by_abbreviation[abbreviation]
+        self.aliases = MappingProxyType(aliases)
+
+        self.power_rating = _frozen([team.power_rating for team in teams], np.float32)
+        self.off_rating = _frozen([team.off_rating for team in teams], np.float32)
+        self.def_rating = _frozen([team.def_rating for team in teams], np.float32)
+        self.recent_form = _frozen([team.recent_form for team in teams], np.float32)
+        self.division_id = _frozen([sorted(set(self.divisions)).index(d) for d in self.divisions], np.int8)
+
+    def __len__(self) -> int:
+        return len(self.teams)
+
+    def lookup(self, name: str) -> Optional[int]:
+        """Team id for any alias, falling back to the last word as the nickname"""
+        name = str(name).strip().lower()
+        team_id = self.aliases.get(name)
+        if team_id is None and name:
+            team_id = self.aliases.get(name.split()[-1])
+        return team_id
+
+    def get(self, name: str) -> Optional[Team]:
+        team_id = self.lookup(name)
+        return None if team_id is None else self.teams[team_id]
+
+    def ids(self, names: Iterable[str]) -> np.ndarray:
+        """Team id per name, -1 where unknown"""
+        lookups = (self.lookup(name) for name in names)
+        return np.array([-1 if team_id is None else team_id for team_id in lookups], dtype=np.int64)
+
+    def ratings(self, names: Iterable[str], rating: str, default: float) -> np.ndarray:
+        """One rating array (e.g. 'power_rating') for the names, ``default`` for unknown teams"""
+        ids = self.ids(names)
+        values = getattr(self, rating)
+        return np.where(ids >= 0, values[np.maximum(ids, 0)], default).astype(float)
+
+    def team_key(self, name: str) -> str:
+        """Source-independent key for a team: its abbreviation, else its last word"""
+        team_id = self.lookup(name)
+        if team_id is not None:
+            return self.abbreviations[team_id].lower()
+        words = str(name).split()
+        return words[-1].lower() if words else ''
+
+
+TEAMS = TeamRegistry()
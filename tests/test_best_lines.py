@@ -0,0 +1,104 @@
+import numpy as np
+
+from best_lines import BestLines, _grouped_argmax
+from odds_store import NO_PRICE, OddsStore
+
+
+def make_store(quotes):
+    """Store from [(game key, book, quote columns)] in row order"""
+    store = OddsStore()
+    for game_key, book, values in quotes:
+        away, home = game_key.split(' @ ')
+        store.upsert(game_key, away, home, book, **values)
+    return store
+
+
+def best_books(best_lines, game_key):
+    game = best_lines.store.game_index(game_key)
+    return {side: (best_lines.best_quote(game, side) or {}).get('book') for side in best_lines.best}
+
+
+def test_grouped_argmax_picks_first_row_on_ties():
+    groups = np.array([0, 0, 0, 1, 1, 2])
+    keys = np.array([1.0, 3.0, 3.0, 2.0, 2.0, -np.inf])
+
+    assert _grouped_argmax(groups, keys, 4).tolist() == [1, 3, -1, -1]
+
+
+def test_tie_goes_to_the_same_book_in_full_and_per_game_scans():
+    store = make_store([('A @ H', book, {'spread': 3.0, 'spread_price_home': -110, 'spread_price_away': -110,
+                                         'moneyline_home': -150, 'moneyline_away': 130})
+                        for book in ('BookA', 'BookB')])
+    full = BestLines(store)
+    per_game = BestLines(store)
+    per_game.update_game(0)
+
+    assert best_books(full, 'A @ H')['spread_home'] == 'BookA'
+    for side in full.best:
+        assert full.best[side].tolist() == per_game.best[side].tolist()
+
+
+def test_line_beats_price_and_price_breaks_line_ties():
+    store = make_store([
+        ('A @ H', 'BookA', {'spread': 3.0, 'spread_price_home': -105, 'spread_price_away': -130}),
+        ('A @ H', 'BookB', {'spread': 2.5, 'spread_price_home': -125, 'spread_price_away': -105}),
+        ('A @ H', 'BookC', {'spread': 2.5, 'spread_price_home': -115, 'spread_price_away': -100}),
+    ])
+    books = best_books(BestLines(store), 'A @ H')
+
+    # Home bettors want the lowest spread, then the best price at it; away bettors the highest
+    assert books['spread_home'] == 'BookC'
+    assert books['spread_away'] == 'BookA'
+
+
+def test_missing_spread_price_ranks_as_standard():
+    store = make_store([
+        ('A @ H', 'BookA', {'spread': 3.0}),
+        ('A @ H', 'BookB', {'spread': 3.0, 'spread_price_home': -115, 'spread_price_away': -105}),
+    ])
+    best_lines = BestLines(store)
+    books = best_books(best_lines, 'A @ H')
+
+    assert books['spread_home'] == 'BookA'  # unpriced (-110) beats -115
+    assert books['spread_away'] == 'BookB'  # -105 beats unpriced (-110)
+    assert best_lines.best_quote(0, 'spread_home')['price'] is None
+
+
+def test_missing_moneyline_has_no_best_quote():
+    store = make_store([('A @ H', 'BookA', {'spread': 3.0, 'moneyline_home': NO_PRICE})])
+
+    assert BestLines(store).best_quote(0, 'ml_home') is None
+
+
+def test_carry_over_remaps_rows_when_books_change():
+    unchanged = {'spread': 2.5, 'moneyline_home': -140, 'moneyline_away': 120}
+    previous = BestLines(make_store([
+        ('X @ Y', 'BookA', {'spread': -1.0, 'moneyline_home': 105, 'moneyline_away': -125}),
+        ('A @ H', 'BookB', unchanged),
+    ]))
+    # BookA disappears and BookC appears, so books, games and rows all get new indices
+    store = make_store([
+        ('Q @ R', 'BookB', {'spread': 4.0}),
+        ('X @ Y', 'BookC', {'spread': -1.5, 'moneyline_home': 110, 'moneyline_away': -130}),
+        ('A @ H', 'BookB', unchanged),
+    ])
+    dirty = [store.game_index('X @ Y'), store.game_index('Q @ R')]
+
+    carried = BestLines.carry_over(previous, store, dirty)
+
+    fresh = BestLines(store)
+    for side in fresh.best:
+        assert carried.best[side].tolist() == fresh.best[side].tolist()
+
+
+def test_carry_over_keeps_clean_games_without_rescanning():
+    quotes = {'spread': 2.5, 'spread_price_home': -110, 'spread_price_away': -110,
+              'moneyline_home': -140, 'moneyline_away': 120}
+    previous = BestLines(make_store([('A @ H', 'BookB', quotes), ('X @ Y', 'BookA', {'spread': -1.0})]))
+    store = make_store([('N @ M', 'BookC', {'spread': 7.0}), ('A @ H', 'BookB', quotes)])
+
+    carried = BestLines.carry_over(previous, store, dirty_games=[store.game_index('N @ M')])
+
+    assert best_books(carried, 'A @ H') == best_books(BestLines(store), 'A @ H')
+    assert best_books(carried, 'N @ M')['spread_home'] == 'BookC'
+    assert carried.best['spread_home'][store.game_index('A @ H')] == store.row_table()[1, store.books.ids['BookB']]
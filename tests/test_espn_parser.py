@@ -0,0 +1,133 @@
+import io
+import json
+import math
+
+import pytest
+
+import espn_parser
+from espn_parser import GameRecord, QuoteRecord, parse_scoreboard, sportsbooks_dict
+from odds_store import NO_PRICE, OddsStore
+
+NOISE = {'status': {'type': {'state': 'pre'}}, 'links': [{'href': 'https://www.espn.com', 'rel': ['summary']}]}
+
+
+def competitor(side, name):
+    entry = {'id': '1', 'records': [{'summary': '0-0'}], 'team': {'displayName': name, 'abbreviation': name[:3]}}
+    if side is not None:
+        entry['homeAway'] = side
+    return entry
+
+
+def payload():
+    odds = [
+        {'provider': {'name': 'DraftKings', 'priority': 1}, 'details': 'PHI -3.5', 'spread': -3.5,
+         'overUnder': 47.5, 'overOdds': -110, 'underOdds': -105,
+         'homeTeamOdds': {'moneyLine': -180, 'spreadOdds': -110, 'team': {'id': '1'}},
+         'awayTeamOdds': {'moneyLine': 155, 'spreadOdds': -110}},
+        {'provider': {'name': 'FanDuel'}, 'spread': '2.5', 'overUnder': None,
+         'homeTeamOdds': {'moneyLine': 'EVEN'}},
+        {'provider': {'id': '9'}, 'spread': -1.0},  # no book name: dropped
+    ]
+    events = [
+        {'id': '1', 'competitions': [{'competitors': [competitor('home', 'Philadelphia Eagles'),
+                                                      competitor('away', 'Dallas Cowboys')],
+                                      'odds': odds, **NOISE}], **NOISE},
+        # homeAway missing: ESPN lists the home team first
+        {'id': '2', 'competitions': [{'competitors': [competitor(None, 'Los Angeles Chargers'),
+                                                      competitor(None, 'Kansas City Chiefs')]}]},
+        # a single competitor is not a game
+        {'id': '3', 'competitions': [{'competitors': [competitor('home', 'Buffalo Bills')]}]},
+    ]
+    return json.dumps({'leagues': [{'id': '28'}], 'events': events}).encode()
+
+
+def as_comparable(records):
+    """NaN-safe view of records for equality checks"""
+    return [(r.away_team, r.home_team, [tuple('nan' if isinstance(v, float) and math.isnan(v) else v for v in q)
+                                        for q in r.quotes]) for r in records]
+
+
+@pytest.fixture(params=['stream', 'projected'])
+def decoder(request, monkeypatch):
+    if request.param == 'projected':
+        monkeypatch.setattr(espn_parser, 'ijson', None)
+    elif espn_parser.ijson is None:
+        pytest.skip('ijson is not installed')
+    return request.param
+
+
+def test_records(decoder):
+    records = parse_scoreboard(payload())
+
+    assert [(r.away_team, r.home_team) for r in records] == [
+        ('Dallas Cowboys', 'Philadelphia Eagles'), ('Kansas City Chiefs', 'Los Angeles Chargers')]
+    draftkings, fanduel = records[0].quotes
+    # ESPN's home line -3.5 is a 3.5-point expected home margin in the store's convention
+    assert draftkings == QuoteRecord('DraftKings', 3.5, -110, -110, 47.5, -110, -105, -180, 155)
+    assert fanduel.spread == -2.5 and math.isnan(fanduel.total)
+    assert (fanduel.moneyline_home, fanduel.moneyline_away, fanduel.over_price) == (100, NO_PRICE, NO_PRICE)
+    assert records[1].quotes == ()
+
+
+def test_file_like_payload(decoder):
+    assert as_comparable(parse_scoreboard(io.BytesIO(payload()))) == as_comparable(parse_scoreboard(payload()))
+
+
+def test_stream_and_projected_decoders_agree(monkeypatch):
+    if espn_parser.ijson is None:
+        pytest.skip('ijson is not installed')
+    streamed = parse_scoreboard(payload())
+    monkeypatch.setattr(espn_parser, 'ijson', None)
+
+    assert as_comparable(streamed) == as_comparable(parse_scoreboard(payload()))
+
+
+def test_sportsbooks_dict():
+    record = GameRecord('Away', 'Home', (QuoteRecord('BookA', 3.0, -110, -110, 44.0, -110, -110, -150, 130),))
+
+    assert sportsbooks_dict(record) == {'BookA': {
+        'spread': 3.0, 'spread_price_home': -110, 'spread_price_away': -110, 'total': 44.0,
+        'over_price': -110, 'under_price': -110, 'moneyline_home': -150, 'moneyline_away': 130}}
+
+
+def games_from(records, typed):
+    """Fetcher-shaped games dict, with or without the typed quotes attached"""
+    games = {}
+    for record in records:
+        game = {'away_team': record.away_team, 'home_team': record.home_team,
+                'sportsbooks': sportsbooks_dict(record)}
+        if typed:
+            game['quotes'] = record.quotes
+        games[f"{record.away_team} @ {record.home_team}"] = game
+    return games
+
+
+def test_typed_quotes_load_like_parsed_ones(decoder):
+    records = parse_scoreboard(payload())
+    typed = OddsStore.from_odds(games_from(records, typed=True))
+    parsed = OddsStore.from_odds(games_from(records, typed=False))
+
+    assert typed.game_keys == parsed.game_keys
+    assert typed.game_digests().tolist() == parsed.game_digests().tolist()
+    assert len(typed) == 2
+
+
+def test_typed_quotes_win_over_display_quotes_for_the_same_book():
+    quote = QuoteRecord('DraftKings', 3.5, -110, -110, 47.5, -110, -105, -180, 155)
+    games = {'A @ H': {'away_team': 'A', 'home_team': 'H', 'quotes': (quote,),
+                       # The display copy is never re-parsed; other books merged in from other sources are
+                       'sportsbooks': {'DraftKings': {'spread': 'OFF'}, 'FanDuel': {'spread': '+2.5 (-105)'}}}}
+
+    frame = OddsStore.from_odds(games).frame().set_index('sportsbook')
+    assert (frame.loc['DraftKings', 'spread'], frame.loc['DraftKings', 'under_price']) == (3.5, -105)
+    assert (frame.loc['FanDuel', 'spread'], frame.loc['FanDuel', 'spread_price_home']) == (2.5, -105)
+
+
+def test_upsert_quotes_returns_rows_written():
+    store = OddsStore()
+    records = parse_scoreboard(payload())
+
+    assert [store.upsert_quotes(f"{r.away_team} @ {r.home_team}", r.away_team, r.home_team, r.quotes,
+                                updated_at=5.0) for r in records] == [2, 0]
+    assert store.n_games == 2
+    assert store.column('updated_at').tolist() == [5.0, 5.0]
@@ -0,0 +1,50 @@
+import numpy as np
+
+import odds_engine
+from game_simulator import score_means, simulate_slate
+from season_simulator import build_schedule
+from team_data import DEFAULT_OFF_RATING, DEFAULT_POWER_RATING, TEAMS
+
+
+def engine_slate(away_teams, home_teams, seed=0):
+    return odds_engine.generate_slate(
+        TEAMS.ratings(away_teams, 'power_rating', DEFAULT_POWER_RATING),
+        TEAMS.ratings(home_teams, 'power_rating', DEFAULT_POWER_RATING),
+        TEAMS.ratings(away_teams, 'off_rating', DEFAULT_OFF_RATING),
+        TEAMS.ratings(home_teams, 'off_rating', DEFAULT_OFF_RATING),
+        rng=np.random.default_rng(seed),
+    )
+
+
+def season_matchups():
+    schedule = build_schedule()
+    return [TEAMS.names[away] for away, _ in schedule], [TEAMS.names[home] for _, home in schedule]
+
+
+def test_simulated_totals_match_engine_totals():
+    away_teams, home_teams = season_matchups()
+    market_total = np.median(engine_slate(away_teams, home_teams)['total'], axis=1)
+
+    away_mean, home_mean = score_means(away_teams, home_teams)
+    simulated = simulate_slate(away_mean, home_mean, 20_000, np.random.default_rng(1)).mean_total()
+
+    assert abs(np.mean(simulated - market_total)) < 1.0
+
+
+def test_simulated_margins_match_engine_spreads():
+    away_teams, home_teams = season_matchups()
+    market_spread = np.median(engine_slate(away_teams, home_teams)['spread'], axis=1)
+
+    away_mean, home_mean = score_means(away_teams, home_teams)
+
+    assert abs(np.mean(home_mean - away_mean - market_spread)) < 1.0
+
+
+def test_totals_split_between_over_and_under():
+    away_teams, home_teams = season_matchups()
+    market_total = np.median(engine_slate(away_teams, home_teams)['total'], axis=1)
+
+    away_mean, home_mean = score_means(away_teams, home_teams)
+    over = simulate_slate(away_mean, home_mean, 20_000, np.random.default_rng(2)).total_probabilities(market_total)['over']
+
+    assert 0.3 < np.mean(over[:, 0] > 0.5) < 0.7
@@ -0,0 +1,102 @@
+import requests
+
+import http_client
+from http_client import PooledHttpClient, RetryBudget
+
+
+def response(status, content=b'', **headers):
+    result = requests.Response()
+    result.status_code = status
+    result._content = content
+    result._content_consumed = True  # as after a non-streamed GET
+    result.headers.update(headers)
+    return result
+
+
+class ScriptedSession:
+    """Stands in for requests.Session: answers GETs from a script and records each request's headers"""
+
+    def __init__(self, *replies):
+        self.replies = list(replies)
+        self.requests = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.requests.append(dict(headers or {}))
+        reply = self.replies.pop(0) if len(self.replies) > 1 else self.replies[0]
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+    def close(self):
+        pass
+
+
+def client_with(*replies, **options):
+    options.setdefault('backoff_base', 0.001)
+    client = PooledHttpClient(**options)
+    client.session = ScriptedSession(*replies)
+    return client
+
+
+def test_not_modified_serves_a_private_copy_of_the_cached_response():
+    client = client_with(response(200, b'{"v": 1}', ETag='"v1"', **{'Last-Modified': 'Sun, 07 Sep 2025'}),
+                         response(304))
+
+    first = client.get('https://example.test/odds', params={'week': 1})
+    second = client.get('https://example.test/odds', params={'week': 1})
+    third = client.get('https://example.test/odds', params={'week': 1})
+
+    assert client.session.requests[0] == {}
+    assert client.session.requests[1] == {'If-None-Match': '"v1"', 'If-Modified-Since': 'Sun, 07 Sep 2025'}
+    assert (second.status_code, second.content, second.from_cache) == (200, b'{"v": 1}', True)
+    assert second is not third and second is not first
+    assert first.from_cache is False
+
+
+def test_responses_without_validators_are_not_revalidated():
+    client = client_with(response(200, b'a'), response(200, b'b'))
+
+    client.get('https://example.test/odds')
+    assert client.get('https://example.test/odds').content == b'b'
+    assert client.session.requests == [{}, {}]
+
+
+def test_retries_until_success():
+    client = client_with(requests.ConnectionError('reset'), response(503), response(200, b'ok'))
+
+    result = client.get('https://example.test/odds')
+    assert (result.status_code, result.from_cache) == (200, False)
+    assert len(client.session.requests) == 3
+
+
+def test_exhausted_budget_stops_retrying():
+    budget = RetryBudget(ratio=0.0, initial_tokens=1.0)
+    client = client_with(response(503), max_retries=5, budget=budget)
+
+    assert client.get('https://example.test/odds').status_code == 503
+    assert len(client.session.requests) == 2  # the first attempt and the one budgeted retry
+    assert client.get('https://example.test/odds').status_code == 503
+    assert len(client.session.requests) == 3  # no tokens left: no retry at all
+
+
+def test_budget_earns_tokens_per_request_up_to_its_cap():
+    budget = RetryBudget(ratio=0.5, initial_tokens=0.0, max_tokens=2.0)
+    assert not budget.try_spend()
+
+    for _ in range(10):
+        budget.record_request()
+    assert [budget.try_spend() for _ in range(3)] == [True, True, False]
+
+
+def test_backoff_jitter_stays_within_bounds(monkeypatch):
+    client = PooledHttpClient(backoff_base=0.25, backoff_cap=2.0)
+    for attempt, bound in enumerate([0.25, 0.5, 1.0, 2.0, 2.0]):
+        delays = [client._backoff(attempt) for _ in range(500)]
+        assert 0 <= min(delays) and max(delays) <= bound
+        assert max(delays) > bound / 2  # full jitter spreads over the whole range
+
+    slept = []
+    monkeypatch.setattr(http_client.time, 'sleep', slept.append)
+    client.session = ScriptedSession(response(502), response(502), response(200))
+    client.get('https://example.test/odds')
+    assert len(slept) == 2 and 0 <= slept[0] <= 0.25 and 0 <= slept[1] <= 0.5
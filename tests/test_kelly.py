@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+
+from kelly import (BANKROLL_CAP, KELLY_FRACTION, MARKET_SLOTS, MONEYLINE, SPREAD, TOTAL, bet_moments,
+                   same_game_covariance, simultaneous_kelly)
+
+
+def single_bet(p_win, decimal, slot=SPREAD):
+    """(mean, cov) of one block holding a single bet in ``slot``"""
+    mean = np.full((1, MARKET_SLOTS), np.nan)
+    variance = np.zeros((1, MARKET_SLOTS))
+    mean[0, slot], variance[0, slot] = bet_moments(p_win, 0.0, decimal)
+    return mean, same_game_covariance(variance, np.ones((1, MARKET_SLOTS), dtype=bool))
+
+
+def random_slate(rng, n_blocks):
+    p_win = rng.uniform(0.4, 0.65, size=(n_blocks, MARKET_SLOTS))
+    decimal = rng.uniform(1.6, 2.6, size=(n_blocks, MARKET_SLOTS))
+    mean, variance = bet_moments(p_win, rng.uniform(0, 0.05, size=p_win.shape), decimal)
+    home_side = rng.random((n_blocks, MARKET_SLOTS)) < 0.5
+    return mean, same_game_covariance(variance, home_side)
+
+
+def test_bet_moments():
+    mean, variance = bet_moments(0.5, 0.1, 2.0)
+
+    # Wins pay +1 with p=.5, pushes return the stake, losses cost 1 with p=.4
+    assert mean == pytest.approx(0.1)
+    assert variance == pytest.approx(0.5 + 0.4 - 0.01)
+
+
+@pytest.mark.parametrize('p_win, decimal', [(0.55, 2.0), (0.53, 1.909), (0.35, 3.2)])
+def test_single_bet_matches_closed_form_kelly(p_win, decimal):
+    mean, cov = single_bet(p_win, decimal)
+    exact = (p_win * decimal - 1) / (decimal - 1)
+
+    full = simultaneous_kelly(mean, cov, cap=1.0, fraction=1.0)
+    # The quadratic growth model stakes mean / variance, which is within a few percent of log-optimal Kelly
+    assert full[0, SPREAD] == pytest.approx(mean[0, SPREAD] / cov[0, SPREAD, SPREAD])
+    assert full[0, SPREAD] == pytest.approx(exact, rel=0.1)
+    assert full[0, [TOTAL, MONEYLINE]].tolist() == [0.0, 0.0]
+    assert simultaneous_kelly(mean, cov, cap=1.0)[0, SPREAD] == pytest.approx(KELLY_FRACTION * full[0, SPREAD])
+
+
+@pytest.mark.parametrize('p_win, decimal', [(0.5, 2.0), (0.45, 2.0), (0.5238, 1.909)])
+def test_no_stake_without_an_edge(p_win, decimal):
+    mean, cov = single_bet(p_win, decimal)
+
+    assert np.all(simultaneous_kelly(mean, cov) == 0)
+
+
+def test_missing_bets_get_no_stake():
+    mean, cov = single_bet(0.6, 2.0)
+    mean[0, SPREAD] = np.nan
+
+    assert np.all(simultaneous_kelly(mean, cov) == 0)
+
+
+def test_stakes_are_never_negative():
+    rng = np.random.default_rng(0)
+    mean, cov = random_slate(rng, 300)
+
+    stakes = simultaneous_kelly(mean, cov)
+    assert np.all(stakes >= 0)
+    assert np.all(stakes[~(mean > 0)] == 0)
+
+
+def test_each_portfolio_stays_under_the_cap():
+    rng = np.random.default_rng(1)
+    mean, cov = random_slate(rng, 200)
+    portfolio = np.repeat([0, 1, 2, 3], 50)
+    mean[portfolio == 3] = -0.05  # a portfolio with nothing worth betting
+
+    stakes = simultaneous_kelly(mean, cov, portfolio)
+    totals = np.bincount(portfolio, weights=stakes.sum(axis=1))
+    assert np.all(totals <= BANKROLL_CAP + 1e-9)
+    assert totals[:3] == pytest.approx([BANKROLL_CAP] * 3, rel=1e-3)  # plenty of edge: the cap binds
+    assert totals[3] == 0
+
+
+def test_cap_that_does_not_bind_leaves_stakes_alone():
+    mean, cov = single_bet(0.55, 2.0)
+
+    assert simultaneous_kelly(mean, cov, cap=1.0) == pytest.approx(simultaneous_kelly(mean, cov, cap=0.5))
+
+
+def test_correlated_same_game_bets_share_one_stake():
+    mean = np.array([[0.05, np.nan, 0.05]])
+    variance = np.array([[1.0, 0.0, 1.0]])
+    alone = simultaneous_kelly(mean[:, :1], same_game_covariance(variance, np.ones((1, 3), dtype=bool))[:, :1, :1],
+                               cap=1.0)[0, 0]
+
+    same_team = simultaneous_kelly(mean, same_game_covariance(variance, np.ones((1, 3), dtype=bool)), cap=1.0)
+    opposite = simultaneous_kelly(mean, same_game_covariance(variance, np.array([[True, True, False]])), cap=1.0)
+
+    # Two bets on the same team overlap, so together they get less than twice one alone
+    assert alone < same_team.sum() < 2 * alone
+    # Bets on opposite teams hedge each other and are sized up
+    assert opposite.sum() > 2 * alone
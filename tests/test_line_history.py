@@ -0,0 +1,99 @@
+import math
+
+import numpy as np
+
+from line_history import TICK_DTYPE, LineHistory, TickRing, ticks_frame
+from odds_store import NO_PRICE, OddsStore
+
+
+def tick(ts, spread=3.0, moneyline_home=-150):
+    value = np.zeros(1, dtype=TICK_DTYPE)[0]
+    value['ts'], value['spread'], value['total'], value['moneyline_home'] = ts, spread, 44.5, moneyline_home
+    return value
+
+
+def timestamps(views):
+    return np.concatenate(views)['ts'].tolist() if views else []
+
+
+def test_ring_appends_in_order(tmp_path):
+    ring = TickRing(str(tmp_path / 'm.ring'), capacity=8)
+    assert len(ring) == 0 and ring.last() is None
+
+    for ts in range(3):
+        ring.append(tick(ts))
+    assert (len(ring), ring.written, float(ring.last()['ts'])) == (3, 3, 2.0)
+    assert timestamps(ring.segments()) == [0.0, 1.0, 2.0]
+
+
+def test_ring_wraps_and_keeps_the_newest_ticks_oldest_first(tmp_path):
+    ring = TickRing(str(tmp_path / 'm.ring'), capacity=4)
+    for ts in range(10):
+        ring.append(tick(ts))
+
+    assert (len(ring), ring.written) == (4, 10)
+    assert len(ring.segments()) == 2
+    assert timestamps(ring.segments()) == [6.0, 7.0, 8.0, 9.0]
+    # A window across the wrap point comes back as two views
+    assert timestamps(ring.window(7, 9)) == [7.0, 8.0]
+    assert len(ring.window(7, 9)) == 2
+    assert timestamps(ring.window(0, 6)) == []
+
+
+def test_window_views_share_the_mapping(tmp_path):
+    ring = TickRing(str(tmp_path / 'm.ring'), capacity=4)
+    for ts in range(3):
+        ring.append(tick(ts))
+
+    view, = ring.window(0, 10)
+    assert np.shares_memory(view, ring._ticks)
+
+
+def test_ring_survives_reopen_with_its_own_capacity(tmp_path):
+    path = str(tmp_path / 'm.ring')
+    ring = TickRing(path, capacity=4)
+    for ts in range(6):
+        ring.append(tick(ts, spread=ts / 2))
+    ring.flush()
+    del ring
+
+    reopened = TickRing(path, capacity=64)
+    assert (reopened.capacity, reopened.written) == (4, 6)
+    assert timestamps(reopened.segments()) == [2.0, 3.0, 4.0, 5.0]
+    reopened.append(tick(6))
+    assert timestamps(reopened.segments()) == [3.0, 4.0, 5.0, 6.0]
+
+
+def store_with(spread, updated_at, moneyline_home=-150):
+    store = OddsStore()
+    store.upsert('A @ H', 'A', 'H', 'Book', updated_at=updated_at, spread=spread, total=float('nan'),
+                 moneyline_home=moneyline_home)
+    return store
+
+
+def test_record_store_appends_only_changed_quotes(tmp_path):
+    history = LineHistory(str(tmp_path), capacity=16)
+
+    assert history.record_store(store_with(3.0, 1.0)) == 1
+    assert history.record_store(store_with(3.0, 2.0)) == 0  # same quote, NaN total included
+    assert history.record_store(store_with(3.5, 3.0)) == 1
+    assert history.record_store(store_with(3.5, 4.0), changed_only=False) == 1
+    assert timestamps(history.window('A @ H', 'Book', 0, 10)) == [1.0, 3.0, 4.0]
+
+
+def test_history_reopens_evicted_rings(tmp_path):
+    history = LineHistory(str(tmp_path), capacity=16, max_open=1)
+    history.ring('A @ H', 'Book').append(tick(1))
+    history.ring('B @ H', 'Book').append(tick(2))  # evicts and flushes the first ring
+
+    assert len(history._rings) == 1
+    assert timestamps(history.window('A @ H', 'Book', 0, 10)) == [1.0]
+    assert timestamps(LineHistory(str(tmp_path), capacity=16).window('B @ H', 'Book', 0, 10)) == [2.0]
+
+
+def test_ticks_frame_marks_missing_prices():
+    frame = ticks_frame([np.array([tick(0), tick(60, moneyline_home=NO_PRICE)], dtype=TICK_DTYPE)])
+
+    assert frame['moneyline_home'].iloc[0] == -150 and math.isnan(frame['moneyline_home'].iloc[1])
+    assert frame['ts'].dt.second.tolist() == [0, 0] and frame['ts'].dt.minute.tolist() == [0, 1]
+    assert len(ticks_frame([])) == 0
@@ -0,0 +1,86 @@
+import pytest
+
+from best_lines import BestLines
+from market_scanner import MAX_ARBITRAGE_PROFIT, scan_opportunities
+from odds_store import OddsStore
+
+GAME = 'Away Team @ Home Team'
+
+
+def scan(quotes):
+    """Opportunities for one game from {book: quote columns}"""
+    store = OddsStore()
+    for book, values in quotes.items():
+        store.upsert(GAME, 'Away Team', 'Home Team', book, **values)
+    return scan_opportunities(BestLines(store))
+
+
+def test_moneyline_arbitrage_and_stake_split():
+    found = scan({
+        'BookA': {'moneyline_home': 110, 'moneyline_away': -130},
+        'BookB': {'moneyline_home': -125, 'moneyline_away': 105},
+    })
+
+    assert len(found) == 1
+    arb = found[0]
+    assert (arb['type'], arb['market']) == ('arbitrage', 'moneyline')
+    assert arb['implied_probability'] == pytest.approx(1 / 2.1 + 1 / 2.05)
+    assert arb['profit_pct'] == pytest.approx(100 * (1 / arb['implied_probability'] - 1))
+
+    home, away = arb['legs']
+    assert (home['book'], away['book']) == ('BookA', 'BookB')
+    assert home['stake_pct'] + away['stake_pct'] == pytest.approx(100)
+    # Stakes split so that either side pays out the same
+    assert home['stake_pct'] * 2.1 == pytest.approx(away['stake_pct'] * 2.05)
+
+
+def test_no_arbitrage_at_standard_prices():
+    assert scan({
+        'BookA': {'moneyline_home': -110, 'moneyline_away': -110},
+        'BookB': {'moneyline_home': -115, 'moneyline_away': -105},
+    }) == []
+
+
+def test_implausible_arbitrage_is_dropped():
+    found = scan({
+        'BookA': {'moneyline_home': 186, 'moneyline_away': -220},
+        'BookB': {'moneyline_home': -240, 'moneyline_away': 199},
+    })
+
+    assert 100 * (1 / (1 / 2.86 + 1 / 2.99) - 1) > 100 * MAX_ARBITRAGE_PROFIT
+    assert found == []
+
+
+def test_malformed_prices_are_skipped():
+    # +50 is not an American price; the scanner must not treat it as a huge favourite or a long shot
+    found = scan({
+        'BookA': {'spread': 2.5, 'spread_price_home': 50, 'spread_price_away': -110},
+        'BookB': {'spread': 6.5, 'spread_price_home': -110, 'spread_price_away': -110},
+    })
+
+    assert found == []
+
+
+def test_spread_middle_window_width():
+    found = scan({
+        'BookA': {'spread': 2.5, 'spread_price_home': -110, 'spread_price_away': -110},
+        'BookB': {'spread': 6.5, 'spread_price_home': -110, 'spread_price_away': -110},
+    })
+
+    assert len(found) == 1
+    middle = found[0]
+    assert (middle['type'], middle['market']) == ('middle', 'spread')
+    assert middle['middle_width'] == pytest.approx(4.0)
+    home, away = middle['legs']
+    assert (home['book'], home['line']) == ('BookA', 2.5)
+    assert (away['book'], away['line']) == ('BookB', 6.5)
+
+
+def test_total_middle_uses_unpriced_quotes_at_standard_price():
+    found = scan({
+        'BookA': {'total': 44.0},
+        'BookB': {'total': 46.5},
+    })
+
+    assert [(o['type'], o['market'], o['middle_width']) for o in found] == [('middle', 'total', 2.5)]
+    assert found[0]['legs'][0]['price'] is None
@@ -0,0 +1,123 @@
+import math
+import urllib.error
+import urllib.request
+
+import pytest
+
+import metrics
+from metrics import ERRORS, Histogram, MetricsRegistry, start_metrics_server, timed
+
+
+def histogram(*values, buckets=(1.0, 2.0, 4.0), labels=None):
+    metric = Histogram('latency_seconds', 'Latency', ('stage',), buckets)
+    for value in values:
+        metric.observe(value, **(labels or {'stage': 'fetch'}))
+    return metric
+
+
+def test_observations_land_in_inclusive_upper_bound_buckets():
+    metric = histogram(0.5, 1.0, 1.5, 2.0, 3.0, 9.0)
+
+    (counts, total), = metric.series().values()
+    assert counts == [2, 2, 1, 1]
+    assert total == pytest.approx(17.0)
+
+
+@pytest.mark.parametrize('q, expected', [(0.25, 1.0), (0.5, 1.5), (0.75, 2.0), (1.0, 4.0)])
+def test_quantile_interpolates_inside_the_bucket(q, expected):
+    metric = histogram(0.5, 1.5, 1.5, 3.0)
+
+    (counts, _), = metric.series().values()
+    assert metric.quantile(q, counts) == pytest.approx(expected)
+
+
+def test_quantile_edge_cases():
+    metric = histogram(10.0, 20.0)
+
+    (counts, _), = metric.series().values()
+    assert metric.quantile(0.5, counts) == 4.0  # beyond the last bound: the bound itself
+    assert math.isnan(metric.quantile(0.5, [0, 0, 0, 0]))
+
+
+def test_render_in_prometheus_text_format():
+    registry = MetricsRegistry()
+    counter = registry.counter('qwerk_results_total', 'Outcomes', ('source', 'outcome'))
+    counter.inc(source='espn', outcome='ok')
+    counter.inc(2, source='say "hi"\n', outcome='ok')
+    registry.gauge('qwerk_games', 'Games').set(16)
+    latency = registry.histogram('qwerk_seconds', 'Latency', ('stage',), buckets=(0.005, 1.0))
+    latency.observe(0.25, stage='fetch')
+    latency.observe(5, stage='fetch')
+
+    assert registry.render().splitlines() == [
+        '# HELP qwerk_results_total Outcomes',
+        '# TYPE qwerk_results_total counter',
+        'qwerk_results_total{source="espn",outcome="ok"} 1',
+        'qwerk_results_total{source="say \\"hi\\"\\n",outcome="ok"} 2',
+        '# HELP qwerk_games Games',
+        '# TYPE qwerk_games gauge',
+        'qwerk_games 16',
+        '# HELP qwerk_seconds Latency',
+        '# TYPE qwerk_seconds histogram',
+        'qwerk_seconds_bucket{stage="fetch",le="0.005"} 0',
+        'qwerk_seconds_bucket{stage="fetch",le="1"} 1',
+        'qwerk_seconds_bucket{stage="fetch",le="+Inf"} 2',
+        'qwerk_seconds_sum{stage="fetch"} 5.25',
+        'qwerk_seconds_count{stage="fetch"} 2',
+    ]
+
+
+def test_registering_a_name_twice_keeps_the_first_metric():
+    registry = MetricsRegistry()
+    first = registry.counter('qwerk_total', 'Count')
+
+    assert registry.counter('qwerk_total', 'Count again') is first
+
+
+def test_summary_reports_latency_in_milliseconds():
+    registry = MetricsRegistry()
+    latency = registry.histogram('qwerk_seconds', 'Latency', ('stage',), buckets=(0.01, 0.1))
+    for value in (0.005, 0.05, 0.05, 0.05):
+        latency.observe(value, stage='predict')
+
+    row, = registry.summary()
+    assert row['stage'] == 'predict' and row['count'] == 4
+    assert row['mean_ms'] == pytest.approx(38.75)
+    assert row['p50_ms'] == pytest.approx(40.0)
+
+
+def test_timed_observes_and_counts_errors():
+    metric = histogram(buckets=(1.0,))
+
+    @timed(metric, stage='unit-test-stage')
+    def fails():
+        raise KeyError('boom')
+
+    with timed(metric, stage='unit-test-stage'):
+        pass
+    before = ERRORS.values().get(('unit-test-stage', 'KeyError'), 0)
+    with pytest.raises(KeyError):
+        fails()
+
+    assert sum(metric.series()[('unit-test-stage',)][0]) == 2
+    assert ERRORS.values()[('unit-test-stage', 'KeyError')] == before + 1
+
+
+def test_metrics_server():
+    server = start_metrics_server(port=0, host='127.0.0.1')
+    try:
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        with urllib.request.urlopen(f"{base}/metrics", timeout=5) as response:
+            assert response.headers['Content-Type'].startswith('text/plain; version=0.0.4')
+            assert b'# TYPE qwerk_stage_seconds histogram' in response.read()
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"{base}/other", timeout=5)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_no_metrics_server_without_a_port(monkeypatch):
+    monkeypatch.setattr(metrics, 'METRICS_PORT', None)
+
+    assert start_metrics_server() is None
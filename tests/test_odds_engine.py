@@ -0,0 +1,44 @@
+import numpy as np
+
+import odds_engine
+from odds_math import american_to_implied
+
+
+def random_slate(seed, n_games=16):
+    rng = np.random.default_rng(seed)
+    power = rng.uniform(70, 95, size=(2, n_games))
+    offense = rng.uniform(65, 90, size=(2, n_games))
+    return odds_engine.generate_slate(power[0], power[1], offense[0], offense[1], time_factor=1.0, rng=rng)
+
+
+def test_generated_slate_has_no_cross_book_moneyline_arbitrage():
+    for seed in range(20):
+        slate = random_slate(seed)
+
+        # Best price on each side across books, as a bettor would shop them
+        best_home = american_to_implied(slate['moneyline_home']).min(axis=1)
+        best_away = american_to_implied(slate['moneyline_away']).min(axis=1)
+        assert np.all(best_home + best_away > 1)
+
+
+def test_books_shade_spreads_and_totals_but_share_the_moneyline_line():
+    slate = odds_engine.price_books(np.zeros(200), np.full(200, 44.5), np.random.default_rng(0))
+
+    assert np.ptp(slate['spread'], axis=1).max() > 0
+    assert np.ptp(slate['total'], axis=1).max() > 0
+    # Same line everywhere, so books differ only by their hold: -110 books against -105 books
+    assert len(np.unique(slate['moneyline_home'], axis=0)) == 1
+    assert np.all(slate['moneyline_home'] == slate['moneyline_away'])
+
+
+def test_favourite_gets_the_shorter_moneyline():
+    slate = odds_engine.price_books(np.array([7.0, -7.0]), np.array([44.5, 44.5]), np.random.default_rng(0))
+
+    assert np.all(slate['moneyline_home'][0] < 0) and np.all(slate['moneyline_away'][0] > 0)
+    assert np.all(slate['moneyline_home'][1] > 0) and np.all(slate['moneyline_away'][1] < 0)
+
+
+def test_half_point_cleans_float32_lines_for_display():
+    lines = np.array([1.4510417, -2.7604167, 44.25, -0.24], dtype=np.float32)
+
+    assert odds_engine.half_point(lines).tolist() == [1.5, -3.0, 44.0, -0.0]
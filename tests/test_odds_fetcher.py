@@ -0,0 +1,67 @@
+import threading
+import time
+
+from odds_fetcher import fetch_all_sources, merge_odds
+
+
+def game(away, home, simulated=False, **books):
+    record = {'away_team': away, 'home_team': home, 'sportsbooks': books}
+    if simulated:
+        record['simulated'] = True
+    return record
+
+
+LIVE = {'Cowboys @ Eagles': game('Dallas Cowboys', 'Philadelphia Eagles', DraftKings={'spread': -7.0})}
+BACKUP = {'DAL @ PHI': game('DAL', 'PHI', DraftKings={'spread': -3.0}, FanDuel={'spread': -6.5})}
+MOCK = {'Cowboys @ Eagles': game('Cowboys', 'Eagles', simulated=True, DraftKings={'spread': 1.5},
+                                 BetMGM={'spread': 2.0})}
+
+
+def test_priority_wins_whatever_the_completion_order():
+    priority = ['odds_api', 'espn_api']
+    in_order = merge_odds([('odds_api', LIVE), ('espn_api', BACKUP)], priority)
+    reversed_order = merge_odds([('espn_api', BACKUP), ('odds_api', LIVE)], priority)
+
+    assert in_order == reversed_order
+    record, = in_order.values()
+    assert record['sportsbooks'] == {'DraftKings': {'spread': -7.0}, 'FanDuel': {'spread': -6.5}}
+    assert record['sources'] == ['odds_api', 'espn_api']
+
+
+def test_simulated_quotes_never_mix_with_live_ones():
+    for results in ([('espn_api', LIVE), ('web_scraping', MOCK)], [('web_scraping', MOCK), ('espn_api', LIVE)]):
+        merged = merge_odds(results, ['web_scraping', 'espn_api'])
+
+        record, = merged.values()
+        assert record['sportsbooks'] == {'DraftKings': {'spread': -7.0}}
+        assert record['sources'] == ['espn_api']
+        assert not record.get('simulated')
+
+
+def test_simulated_quotes_fill_matchups_without_live_ones():
+    mock = {'Bills @ Jets': game('Bills', 'Jets', simulated=True, DraftKings={'spread': 2.5})}
+
+    merged = merge_odds([('web_scraping', mock), ('espn_api', LIVE)])
+    assert merged['Bills @ Jets']['simulated']
+    assert merged['Bills @ Jets']['sources'] == ['web_scraping']
+    assert len(merged) == 2
+
+
+def test_fetch_merges_in_source_order_when_the_slow_source_outranks_the_fast_one():
+    backup_done = threading.Event()
+
+    def slow_live(timeout):
+        backup_done.wait(timeout)
+        time.sleep(0.05)
+        return LIVE
+
+    def fast_backup(timeout):
+        backup_done.set()
+        return BACKUP
+
+    result = fetch_all_sources({'odds_api': slow_live, 'espn_api': fast_backup}, deadline=5.0, grace=2.0)
+
+    assert result.succeeded == ['espn_api', 'odds_api']  # completion order
+    record, = result.odds.values()
+    assert record['sportsbooks']['DraftKings'] == {'spread': -7.0}
+    assert record['sources'] == ['odds_api', 'espn_api']
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from odds_math import (STANDARD_HOLD, american_to_decimal, american_to_implied, implied_to_american,
+                       no_vig_probabilities, overround, spread_to_moneyline)
+from odds_store import MAX_PRICE, NO_PRICE
+
+PRICES = np.array([-10000, -450, -200, -110, -105, 101, 120, 250, 900, 10000])
+HANDICAPS = np.linspace(-40, 40, 321)
+
+
+def test_american_to_decimal():
+    decimal = american_to_decimal(np.array([-110, -200, 150, 100, NO_PRICE, 50]))
+
+    assert decimal[:4] == pytest.approx([1 + 100 / 110, 1.5, 2.5, 2.0])
+    assert np.isnan(decimal[4:]).all()
+
+
+def test_american_implied_round_trip():
+    implied = american_to_implied(PRICES)
+
+    assert implied == pytest.approx(1 / american_to_decimal(PRICES))
+    assert implied_to_american(implied) == pytest.approx(PRICES)
+
+
+def test_implied_american_round_trip():
+    probability = np.linspace(0.01, 0.99, 99)
+
+    assert american_to_implied(implied_to_american(probability)) == pytest.approx(probability)
+
+
+def test_no_vig_probabilities_sum_to_one():
+    home, away = no_vig_probabilities(np.array([-110, -180]), np.array([-110, 155]))
+
+    assert home + away == pytest.approx([1, 1])
+    assert home == pytest.approx([0.5, 0.6211], abs=1e-4)
+    assert overround(np.stack([american_to_implied(-110), american_to_implied(-110)])) \
+        == pytest.approx(STANDARD_HOLD)
+
+
+def test_fair_moneylines_mirror_each_other():
+    handicap = HANDICAPS[HANDICAPS != 0]
+
+    assert np.array_equal(spread_to_moneyline(handicap), -spread_to_moneyline(-handicap))
+    assert spread_to_moneyline(0.0) == -100
+
+
+def test_held_moneylines_carry_the_hold():
+    handicap = np.linspace(-10, 10, 41)
+    implied = american_to_implied(spread_to_moneyline(handicap, STANDARD_HOLD)) \
+        + american_to_implied(spread_to_moneyline(-handicap, STANDARD_HOLD))
+
+    assert implied == pytest.approx(1 + STANDARD_HOLD, abs=0.005)
+
+
+@pytest.mark.parametrize('hold', [0.0, STANDARD_HOLD])
+def test_moneyline_lengthens_with_the_handicap(hold):
+    prices = spread_to_moneyline(HANDICAPS, hold)
+
+    assert np.all(np.diff(american_to_decimal(prices)) >= 0)
+    assert prices[0] < 0 < prices[-1]
+
+
+def test_moneylines_stay_within_the_storable_range():
+    prices = spread_to_moneyline(np.array([-200.0, -60.0, 60.0, 200.0]), STANDARD_HOLD)
+
+    assert prices.tolist() == [-MAX_PRICE, -MAX_PRICE, MAX_PRICE, MAX_PRICE]
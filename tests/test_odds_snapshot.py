@@ -0,0 +1,111 @@
+import threading
+import time
+
+import pytest
+
+from odds_snapshot import RefreshWorker, SnapshotStore
+
+ODDS = {'A @ H': {'away_team': 'A', 'home_team': 'H', 'sportsbooks': {}}}
+
+
+def test_publish_versions_snapshots():
+    store = SnapshotStore()
+    assert store.latest() is None
+
+    first = store.publish(ODDS, {'A @ H': {}})
+    second = store.publish({}, {})
+    assert (first.version, second.version) == (1, 2)
+    assert store.latest() is second
+
+
+def test_snapshot_is_read_only():
+    odds = dict(ODDS)
+    snapshot = SnapshotStore().publish(odds, {}, opportunities=[{'game': 'A @ H'}], dirty_games=['A @ H'])
+
+    with pytest.raises(TypeError):
+        snapshot.odds['B @ H'] = {}
+    with pytest.raises(TypeError):
+        snapshot.digests['A @ H'] = 1
+    with pytest.raises(AttributeError):
+        snapshot.dirty_games.add('B @ H')
+    with pytest.raises(AttributeError):
+        snapshot.extra = 1  # __slots__: no ad-hoc attributes
+    assert snapshot.opportunities == ({'game': 'A @ H'},)
+
+
+def test_wait_for_update_returns_a_newer_snapshot():
+    store = SnapshotStore()
+    first = store.publish(ODDS, {})
+    threading.Timer(0.05, store.publish, args=({}, {})).start()
+
+    started = time.monotonic()
+    newer = store.wait_for_update(first.version, timeout=5)
+    assert newer.version == 2
+    assert time.monotonic() - started < 4
+
+
+def test_wait_for_update_times_out_with_the_current_snapshot():
+    store = SnapshotStore()
+    assert store.wait_for_update(None, timeout=0.01) is None
+
+    current = store.publish(ODDS, {})
+    assert store.wait_for_update(None, timeout=0.01) is current  # newer than "nothing rendered yet"
+    assert store.wait_for_update(current.version, timeout=0.01) is current
+
+
+def run_worker(worker, cycles):
+    """Run a worker until it has published ``cycles`` snapshots, then stop it"""
+    store = worker.store
+    worker.start()
+    deadline = time.monotonic() + 5
+    while (store.latest() is None or store.latest().version < cycles) and time.monotonic() < deadline:
+        time.sleep(0.005)
+    worker.stop()
+    worker.join(timeout=5)
+    assert not worker.is_alive()
+
+
+def test_worker_publishes_builds_from_the_previous_snapshot():
+    store = SnapshotStore()
+    seen = []
+
+    def build(previous):
+        seen.append(None if previous is None else previous.version)
+        return {'odds': ODDS, 'predictions': {}, 'dirty_games': [len(seen)]}
+
+    run_worker(RefreshWorker(store, build, interval=0.01), cycles=3)
+    assert seen[:3] == [None, 1, 2]
+    assert store.latest().version >= 3 and store.latest().dirty_games == {store.latest().version}
+
+
+def test_worker_keeps_the_last_snapshot_when_a_build_fails():
+    store = SnapshotStore()
+    calls = []
+    errors = []
+
+    def build(previous):
+        calls.append(None if previous is None else previous.version)
+        if len(calls) == 2:
+            raise RuntimeError('source down')
+        if len(calls) == 3:
+            errors.append(worker.last_error)
+        return {'odds': ODDS, 'predictions': {}}
+
+    worker = RefreshWorker(store, build, interval=0.01)
+    run_worker(worker, cycles=2)
+    # The failed cycle published nothing, so the next build still saw snapshot 1
+    assert calls[:3] == [None, 1, 1]
+    assert isinstance(errors[0], RuntimeError)
+    assert worker.last_error is None
+
+
+def test_worker_stops_without_waiting_out_its_interval():
+    store = SnapshotStore()
+    worker = RefreshWorker(store, lambda previous: {'odds': {}, 'predictions': {}}, interval=60)
+    worker.start()
+    store.wait_for_update(None, timeout=5)
+
+    started = time.monotonic()
+    worker.stop()
+    worker.join(timeout=5)
+    assert not worker.is_alive() and time.monotonic() - started < 1
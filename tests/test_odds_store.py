@@ -0,0 +1,114 @@
+import math
+
+import numpy as np
+import pytest
+
+from odds_store import MAX_PRICE, NO_PRICE, OddsStore, parse_line, parse_price
+
+GAMES = {
+    'Dallas Cowboys @ Philadelphia Eagles': {
+        'away_team': 'Dallas Cowboys', 'home_team': 'Philadelphia Eagles',
+        'sportsbooks': {
+            'DraftKings': {'spread': '+3.5 (-110)', 'total': '47.5 (-108)',
+                           'moneyline_home': -175, 'moneyline_away': '+150'},
+            'FanDuel': {'spread': 'PK', 'total': 48.0, 'moneyline_home': 'EVEN', 'moneyline_away': None},
+        },
+    },
+    'Kansas City Chiefs @ Los Angeles Chargers': {
+        'away_team': 'Kansas City Chiefs', 'home_team': 'Los Angeles Chargers',
+        'sportsbooks': {'DraftKings': {'spread': -2.5, 'total': '44.5', 'moneyline_home': 120,
+                                       'moneyline_away': -140}},
+    },
+}
+
+
+def is_missing(parsed):
+    line, price = parsed
+    return math.isnan(line) and price == NO_PRICE
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('+3.5 (-110)', (3.5, -110)),
+    ('-7 (+105)', (-7.0, 105)),
+    ('47.5 (-108)', (47.5, -108)),
+    (' 44 ', (44.0, NO_PRICE)),
+    ('PK', (0.0, NO_PRICE)),
+    ('pk (-110)', (0.0, -110)),
+    ('+1.5 (EVEN)', (1.5, 100)),
+    (-3.5, (-3.5, NO_PRICE)),
+    (np.float32(44.5), (44.5, NO_PRICE)),
+])
+def test_parse_line(text, expected):
+    assert parse_line(text) == expected
+
+
+@pytest.mark.parametrize('text', [None, '', 'N/A', 'OFF', '3.5 (-110', float('nan')])
+def test_parse_line_missing(text):
+    assert is_missing(parse_line(text))
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('-110', -110), ('+145', 145), (145, 145), (-110.0, -110), ('EVEN', 100), (' even ', 100),
+    (None, NO_PRICE), ('', NO_PRICE), ('N/A', NO_PRICE), (float('nan'), NO_PRICE),
+])
+def test_parse_price(text, expected):
+    assert parse_price(text) == expected
+
+
+def test_from_odds_reads_legacy_strings():
+    store = OddsStore.from_odds(GAMES)
+    frame = store.frame().set_index(['game', 'sportsbook'])
+
+    draftkings = frame.loc[('Dallas Cowboys @ Philadelphia Eagles', 'DraftKings')]
+    assert (draftkings['spread'], draftkings['spread_price_home'], draftkings['over_price']) == (3.5, -110, -108)
+    assert (draftkings['moneyline_home'], draftkings['moneyline_away']) == (-175, 150)
+    fanduel = frame.loc[('Dallas Cowboys @ Philadelphia Eagles', 'FanDuel')]
+    assert (fanduel['spread'], fanduel['moneyline_home']) == (0.0, 100)
+    assert math.isnan(fanduel['moneyline_away'])
+
+
+def test_extreme_prices_are_clamped_instead_of_overflowing():
+    games = {'A @ H': {'away_team': 'A', 'home_team': 'H',
+                       'sportsbooks': {'Book': {'moneyline_home': -99900, 'moneyline_away': '+40000',
+                                                'spread': '-20.5 (-110)'}}}}
+    store = OddsStore.from_odds(games)
+    store.upsert('B @ H', 'B', 'H', 'Book', moneyline_home=np.int64(-50000), moneyline_away=NO_PRICE)
+
+    assert store.column('moneyline_home').tolist() == [-MAX_PRICE, -MAX_PRICE]
+    assert store.column('moneyline_away').tolist() == [MAX_PRICE, NO_PRICE]
+    assert store.column('spread_price_home').tolist() == [-110, NO_PRICE]
+
+
+def test_game_digests_are_stable_across_processes():
+    # Pinned value: prediction cache keys depend on it, so every worker and restart must agree
+    store = OddsStore.from_odds(GAMES)
+
+    assert store.game_digests().tolist() == [12339413701871554200, 5303403265461499610]
+
+
+def test_game_digests_ignore_row_order_and_timestamps():
+    store = OddsStore.from_odds(GAMES)
+    reordered = OddsStore()
+    for key, game in reversed(list(GAMES.items())):
+        for book, quote in reversed(list(game['sportsbooks'].items())):
+            spread, spread_price = parse_line(quote.get('spread'))
+            total, total_price = parse_line(quote.get('total'))
+            reordered.upsert(key, game['away_team'], game['home_team'], book, updated_at=0.0,
+                             spread=spread, spread_price_home=spread_price, spread_price_away=spread_price,
+                             total=total, over_price=total_price, under_price=total_price,
+                             moneyline_home=parse_price(quote.get('moneyline_home')),
+                             moneyline_away=parse_price(quote.get('moneyline_away')))
+
+    digests = dict(zip(store.game_keys, store.game_digests().tolist()))
+    assert dict(zip(reordered.game_keys, reordered.game_digests().tolist())) == digests
+
+
+def test_game_digest_changes_only_for_the_changed_game():
+    store = OddsStore.from_odds(GAMES)
+    before = store.game_digests().copy()
+    store.upsert('Kansas City Chiefs @ Los Angeles Chargers', 'Kansas City Chiefs', 'Los Angeles Chargers',
+                 'DraftKings', total=45.0)
+    after = store.game_digests()
+
+    assert after[0] == before[0]
+    assert after[1] != before[1]
@@ -0,0 +1,61 @@
+import os
+
+from prediction_cache import PredictionCache, prediction_key
+
+
+def disk_files(directory):
+    return sorted(name for _, _, files in os.walk(directory) for name in files)
+
+
+def test_memory_lru_evicts_least_recently_used():
+    cache = PredictionCache(max_entries=2)
+    cache.put('a', {'value': 1})
+    cache.put('b', {'value': 2})
+    assert cache.get('a') == {'value': 1}  # 'a' is now the most recently used
+    cache.put('c', {'value': 3})
+
+    assert len(cache) == 2
+    assert cache.get('b') is None
+    assert cache.get('a') == {'value': 1}
+    assert cache.get('c') == {'value': 3}
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_disk_round_trip_across_instances(tmp_path):
+    key = prediction_key('Dallas Cowboys', 'Philadelphia Eagles', 123, 'model-1')
+    PredictionCache(directory=str(tmp_path)).put(key, {'pick': 'OVER', 'confidence': 55.5})
+
+    other = PredictionCache(directory=str(tmp_path))
+    assert other.get(key) == {'pick': 'OVER', 'confidence': 55.5}
+    assert other.disk_hits == 1
+    assert other.get(key) == {'pick': 'OVER', 'confidence': 55.5}
+    assert other.hits == 1
+
+
+def test_model_version_and_quotes_change_the_key(tmp_path):
+    cache = PredictionCache(directory=str(tmp_path))
+    old = prediction_key('Dallas Cowboys', 'Philadelphia Eagles', 123, 'model-1')
+    cache.put(old, {'pick': 'OVER'})
+
+    assert prediction_key('Dallas Cowboys', 'Philadelphia Eagles', 123, 'model-1') == old
+    assert cache.get(prediction_key('Dallas Cowboys', 'Philadelphia Eagles', 123, 'model-2')) is None
+    assert cache.get(prediction_key('Dallas Cowboys', 'Philadelphia Eagles', 124, 'model-1')) is None
+
+
+def test_unserializable_value_stays_in_memory_without_temp_files(tmp_path):
+    cache = PredictionCache(directory=str(tmp_path))
+    cache.put('key', {'value': object()})
+
+    assert 'value' in cache.get('key')
+    assert disk_files(tmp_path) == []
+
+
+def test_prune_removes_old_then_least_recently_used(tmp_path):
+    cache = PredictionCache(directory=str(tmp_path), max_disk_entries=2, max_age=100)
+    for i, key in enumerate(['old', 'k1', 'k2', 'k3']):
+        cache.put(key, {'value': i})
+        os.utime(cache._path(key), (1000 + i * 10, 1000 + i * 10))
+
+    # 'old' is past max_age; of the rest only the two most recently used survive
+    assert cache.prune(now=1000 + 105) == 2
+    assert disk_files(tmp_path) == ['k2.json', 'k3.json']
@@ -0,0 +1,65 @@
+import pytest
+
+from scoreboard_html import TeamMatcher, TeamMentionParser, extract_matchups, pair_matchups
+from team_data import TEAMS
+
+PAGE = """<html><head><title>NFL Scoreboard</title>
+<script>var featured = "Kansas City Chiefs";</script><style>.Bills { color: red }</style></head>
+<body>
+  <section class="game"><span>Dallas Cowboys</span> 20 <span>Philadelphia Eagles</span> 24
+    <p>Recap: the Eagles held on; Cowboys fans left early.</p></section>
+  <section class="game"><span>Chiefs</span> @ <span>Chargers</span></section>
+  <section class="game"><b>San Francisco 49ers</b> vs <b>Seattle Seahawks</b></section>
+  <footer>Jetsons reruns, Ravens-themed merch</footer>
+</body></html>"""
+
+
+def names(matches, text):
+    return [(text[start:end], value) for start, end, value in matches]
+
+
+def test_matcher_prefers_the_longest_whole_word_match():
+    matcher = TeamMatcher({'New York Jets': 1, 'Jets': 2, 'York': 3, 'New York Giants': 4})
+    text = "New York Jets, the Jets' rivals New York Giants, Jetsons, NewYork"
+
+    assert names(matcher.find(text), text) == [('New York Jets', 1), ('Jets', 2), ('New York Giants', 4)]
+
+
+def test_matcher_follows_failure_links():
+    # After "a a a" the automaton must fall back into the middle of "a a b" to find it
+    matcher = TeamMatcher({'a a b': 1, 'a c': 2})
+    text = 'a a a b a c'
+
+    assert matcher.find(text) == [(2, 7, 1), (8, 11, 2)]
+
+
+def test_matcher_is_case_insensitive():
+    matcher = TeamMatcher({'Cowboys': 7})
+
+    assert matcher.find('COWBOYS cowboys') == [(0, 7, 7), (8, 15, 7)]
+
+
+def test_parser_skips_hidden_text_and_joins_split_chunks():
+    parser = TeamMentionParser()
+    for chunk in ('<div>Dallas Cow', 'boys</div><script>Bills</script><p>Bi', 'lls</p>'):
+        parser.feed(chunk)
+    parser.close()
+
+    assert [TEAMS.names[team] for _, team in parser.mentions] == ['Dallas Cowboys', 'Buffalo Bills']
+
+
+def test_pair_matchups_uses_page_order_and_pairs_each_team_once():
+    mentions = [(50, 3), (0, 1), (10, 2), (20, 1), (30, 2), (40, 4), (60, 4)]
+
+    assert pair_matchups(mentions) == [(1, 2), (4, 3)]
+
+
+@pytest.mark.parametrize('chunk_size', [7, 64, len(PAGE)])
+def test_extract_matchups(chunk_size):
+    chunks = [PAGE[i:i + chunk_size] for i in range(0, len(PAGE), chunk_size)]
+
+    assert extract_matchups(chunks) == [
+        ('Dallas Cowboys', 'Philadelphia Eagles'),
+        ('Kansas City Chiefs', 'Los Angeles Chargers'),
+        ('San Francisco 49ers', 'Seattle Seahawks'),
+    ]
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+import season_simulator
+from season_simulator import GAMES_PER_TEAM, build_schedule, run_season_simulation
+from team_data import TEAMS
+
+
+def test_schedule_gives_every_team_17_games():
+    schedule = build_schedule()
+
+    assert np.bincount(schedule.ravel(), minlength=len(TEAMS)).tolist() == [GAMES_PER_TEAM] * len(TEAMS)
+
+
+def test_small_runs_stay_in_process(monkeypatch):
+    def no_pool(workers):
+        raise AssertionError('a small run should not start the process pool')
+
+    monkeypatch.setattr(season_simulator, '_get_pool', no_pool)
+    table = run_season_simulation(season_simulator.MIN_SEASONS_PER_WORKER, workers=4, seed=1)
+
+    assert len(table) == len(TEAMS)
+    assert table['mean_wins'].sum() == pytest.approx(len(build_schedule()))
+
+
+def test_results_do_not_depend_on_the_worker_count():
+    n_seasons = 2 * season_simulator.MIN_SEASONS_PER_WORKER
+    try:
+        pooled = run_season_simulation(n_seasons, workers=2, seed=3)
+        pooled_again = run_season_simulation(n_seasons, workers=2, seed=3)
+    finally:
+        season_simulator.shutdown_pool()
+
+    assert pooled.equals(run_season_simulation(n_seasons, workers=1, seed=3))
+    assert pooled_again.equals(pooled)
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from team_data import DEFAULT_POWER_RATING, TEAMS
+
+
+def test_registry_covers_the_league():
+    assert len(TEAMS) == 32
+    assert len(set(TEAMS.names)) == len(set(TEAMS.nicknames)) == len(set(TEAMS.abbreviations)) == 32
+    assert np.bincount(TEAMS.division_id).tolist() == [4] * 8
+
+
+@pytest.mark.parametrize('alias', ['Dallas Cowboys', 'dallas cowboys', 'Cowboys', 'DAL', ' dal ',
+                                   'The Dallas Cowboys', 'Big D Cowboys'])
+def test_every_alias_resolves_to_one_team(alias):
+    assert TEAMS.names[TEAMS.lookup(alias)] == 'Dallas Cowboys'
+
+
+@pytest.mark.parametrize('alias, name', [('WSH', 'Washington Commanders'), ('LA', 'Los Angeles Rams'),
+                                         ('LAC', 'Los Angeles Chargers'), ('49ers', 'San Francisco 49ers'),
+                                         ('NYJ', 'New York Jets'), ('Giants', 'New York Giants')])
+def test_feed_specific_aliases(alias, name):
+    assert TEAMS.get(alias).name == name
+
+
+@pytest.mark.parametrize('alias', ['', '   ', 'Springfield Atoms', 'XFL'])
+def test_unknown_names(alias):
+    assert TEAMS.lookup(alias) is None
+    assert TEAMS.get(alias) is None
+
+
+def test_ids_and_ratings_for_mixed_names():
+    names = ['KC', 'Springfield Atoms', 'Chiefs']
+
+    assert TEAMS.ids(names).tolist() == [TEAMS.lookup('KC'), -1, TEAMS.lookup('KC')]
+    assert TEAMS.ratings(names, 'power_rating', DEFAULT_POWER_RATING).tolist() == [95.0, 80.0, 95.0]
+
+
+def test_team_key_joins_sources():
+    assert TEAMS.team_key('Dallas Cowboys') == TEAMS.team_key('DAL') == TEAMS.team_key('cowboys') == 'dal'
+    assert TEAMS.team_key('Springfield Atoms') == 'atoms'
+    assert TEAMS.team_key('') == ''
+
+
+def test_registry_is_immutable():
+    with pytest.raises(ValueError):
+        TEAMS.power_rating[0] = 0
+    with pytest.raises(TypeError):
+        TEAMS.aliases['new'] = 0